@@ -44,6 +44,6 @@ setup(
     keywords='dialogflow, cx, google, bot, chatbot, intent, dfcx, entity',
     package_dir={'':'src'},
     packages=find_packages(where='src'),
-    python_requires='>=3.6, <4',
+    python_requires='>=3.7, <4',
     install_requires=['google-cloud-dialogflow-cx']
 )
@@ -243,11 +243,13 @@ class EntityTypes(ScrapiBase):
 
         return entities_dict
 
-    def list_entity_types(self, agent_id: str = None):
+    def list_entity_types(self, agent_id: str = None, page_size: int = 1000):
         """Returns a list of Entity Type objects.
 
         Args:
           agent_id: the formatted CX Agent ID to use
+          page_size: (Optional) the maximum number of items to return in a
+            single page. At most 1000, defaults to 1000.
 
         Returns:
           List of Entity Type objects
@@ -257,16 +259,16 @@ class EntityTypes(ScrapiBase):
 
         request = types.entity_type.ListEntityTypesRequest()
         request.parent = agent_id
+        request.page_size = page_size
 
-        client_options = self._set_region(agent_id)
-        client = services.entity_types.EntityTypesClient(
-            credentials=self.creds, client_options=client_options
+        client = self._get_client(
+            services.entity_types.EntityTypesClient, agent_id
         )
 
         response = client.list_entity_types(request)
 
         entities = []
-        for page in response.pages:
+        for page in self._prefetch_pages(response.pages):
             for entity in page.entity_types:
                 entities.append(entity)
 
@@ -284,9 +286,8 @@ class EntityTypes(ScrapiBase):
         if not entity_id:
             entity_id = self.entity_id
 
-        client_options = self._set_region(entity_id)
-        client = services.entity_types.EntityTypesClient(
-            credentials=self.creds, client_options=client_options
+        client = self._get_client(
+            services.entity_types.EntityTypesClient, entity_id
         )
         response = client.get_entity_type(name=entity_id)
 
@@ -321,9 +322,8 @@ class EntityTypes(ScrapiBase):
         for key, value in kwargs.items():
             setattr(entity_type, key, value)
 
-        client_options = self._set_region(agent_id)
-        client = services.entity_types.EntityTypesClient(
-            credentials=self.creds, client_options=client_options
+        client = self._get_client(
+            services.entity_types.EntityTypesClient, agent_id
         )
 
         request = types.entity_type.CreateEntityTypeRequest()
@@ -379,9 +379,8 @@ class EntityTypes(ScrapiBase):
         paths = kwargs.keys()
         mask = field_mask_pb2.FieldMask(paths=paths)
 
-        client_options = self._set_region(entity_type_id)
-        client = services.entity_types.EntityTypesClient(
-            credentials=self.creds, client_options=client_options
+        client = self._get_client(
+            services.entity_types.EntityTypesClient, entity_type_id
         )
 
         request = types.entity_type.UpdateEntityTypeRequest()
@@ -409,8 +408,7 @@ class EntityTypes(ScrapiBase):
         if obj:
             entity_id = obj.name
         else:
-            client_options = self._set_region(entity_id)
-            client = services.entity_types.EntityTypesClient(
-                credentials=self.creds, client_options=client_options
+            client = self._get_client(
+                services.entity_types.EntityTypesClient, entity_id
             )
             client.delete_entity_type(name=entity_id)
@@ -146,21 +146,22 @@ class Flows(scrapi_base.ScrapiBase):
         request = types.flow.TrainFlowRequest()
         request.name = flow_id
 
-        client_options = self._set_region(flow_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, flow_id)
 
         response = client.train_flow(request)
 
         return response
 
-    def list_flows(self, agent_id: str) -> List[types.Flow]:
+    def list_flows(
+        self, agent_id: str, page_size: int = 1000
+    ) -> List[types.Flow]:
         """Get a List of all Flows in the current Agent.
 
         Args:
           agent_id: CX Agent ID string in the proper format
             projects/<PROJECT ID>/locations/<LOCATION ID>/agents/<AGENT ID>
+          page_size: (Optional) the maximum number of items to return in a
+            single page. At most 1000, defaults to 1000.
 
         Returns:
           List of Flow objects
@@ -168,15 +169,13 @@ class Flows(scrapi_base.ScrapiBase):
 
         request = types.flow.ListFlowsRequest()
         request.parent = agent_id
+        request.page_size = page_size
 
-        client_options = self._set_region(agent_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, agent_id)
         response = client.list_flows(request)
 
         flows = []
-        for page in response.pages:
+        for page in self._prefetch_pages(response.pages):
             for flow in page.flows:
                 flows.append(flow)
         return flows
@@ -218,10 +217,7 @@ class Flows(scrapi_base.ScrapiBase):
           A single CX Flow object
         """
 
-        client_options = self._set_region(flow_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, flow_id)
         response = client.get_flow(name=flow_id)
 
         return response
@@ -266,10 +262,7 @@ class Flows(scrapi_base.ScrapiBase):
 
             request.flow = flow_obj
 
-        client_options = self._set_region(agent_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, agent_id)
         response = client.create_flow(request)
 
         return response
@@ -299,10 +292,7 @@ class Flows(scrapi_base.ScrapiBase):
         paths = kwargs.keys()
         mask = field_mask_pb2.FieldMask(paths=paths)
 
-        client_options = self._set_region(flow_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, flow_id)
         response = client.update_flow(flow=flow, update_mask=mask)
 
         return response
@@ -347,10 +337,7 @@ class Flows(scrapi_base.ScrapiBase):
         request.include_referenced_flows = ref_flows
         request.flow_uri = gcs_path
 
-        client_options = self._set_region(flow_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, flow_id)
         response = client.export_flow(request)
 
         return response.result()
@@ -369,10 +356,7 @@ class Flows(scrapi_base.ScrapiBase):
         request.name = flow_id
         request.include_referenced_flows = ref_flows
 
-        client_options = self._set_region(flow_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, flow_id)
         response = client.export_flow(request)
 
         return (response.result()).flow_content
@@ -416,10 +400,7 @@ class Flows(scrapi_base.ScrapiBase):
         request.flow_content = flow_content
         request.import_option = import_option
 
-        client_options = self._set_region(agent_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, agent_id)
 
         response = client.import_flow(request)
 
@@ -439,9 +420,6 @@ class Flows(scrapi_base.ScrapiBase):
         request.name = flow_id
         request.force = force
 
-        client_options = self._set_region(flow_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, flow_id)
 
         client.delete_flow(request)
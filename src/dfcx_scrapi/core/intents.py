@@ -386,13 +386,16 @@ class Intents(ScrapiBase):
     def list_intents(
         self,
         agent_id: str = None,
-        language_code: str = None) -> List[types.Intent]:
+        language_code: str = None,
+        page_size: int = 1000) -> List[types.Intent]:
         """Exports List of all intents in specific CX Agent.
 
         Args:
           agent_id: the formatted CX Agent ID to use
           language_code: Language code of the intents being uploaded. Ref:
             https://cloud.google.com/dialogflow/cx/docs/reference/language
+          page_size: (Optional) the maximum number of items to return in a
+            single page. At most 1000, defaults to 1000.
 
         Returns:
           List of Intent objects
@@ -406,14 +409,12 @@ class Intents(ScrapiBase):
             request.language_code = language_code
 
         request.parent = agent_id
-        client_options = self._set_region(agent_id)
-        client = services.intents.IntentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        request.page_size = page_size
+        client = self._get_client(services.intents.IntentsClient, agent_id)
         response = client.list_intents(request)
 
         intents = []
-        for page in response.pages:
+        for page in self._prefetch_pages(response.pages):
             for intent in page.intents:
                 intents.append(intent)
 
@@ -442,10 +443,7 @@ class Intents(ScrapiBase):
             request.language_code = language_code
 
         request.name = intent_id
-        client_options = self._set_region(intent_id)
-        client = services.intents.IntentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.intents.IntentsClient, intent_id)
 
         response = client.get_intent(request)
 
@@ -521,10 +519,7 @@ class Intents(ScrapiBase):
         request.parent = agent_id
         request.intent = intent
 
-        client_options = self._set_region(agent_id)
-        client = services.intents.IntentsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(services.intents.IntentsClient, agent_id)
 
         response = client.create_intent(request)
 
@@ -564,10 +559,7 @@ class Intents(ScrapiBase):
         paths = kwargs.keys()
         mask = field_mask_pb2.FieldMask(paths=paths)
 
-        client_options = self._set_region(intent_id)
-        client = services.intents.IntentsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(services.intents.IntentsClient, intent_id)
 
         request = types.intent.UpdateIntentRequest()
 
@@ -590,10 +582,7 @@ class Intents(ScrapiBase):
         if obj:
             intent_id = obj.name
         else:
-            client_options = self._set_region(intent_id)
-            client = services.intents.IntentsClient(
-                client_options=client_options, credentials=self.creds
-            )
+            client = self._get_client(services.intents.IntentsClient, intent_id)
             client.delete_intent(name=intent_id)
 
     def bulk_intent_to_df(
@@ -679,31 +668,31 @@ class Intents(ScrapiBase):
         intent_dict = defaultdict(list)
         intents = self.list_intents(agent_id)
 
-        for intent in intents:  # pylint: disable=R1702
+        for intent in intents:
             if intent.display_name == "Default Negative Intent":
-                pass
+                continue
+
+            if intent.training_phrases:
+                intent_dict[intent.display_name].extend(
+                    "".join(part.text for part in training_phrase.parts)
+                    for training_phrase in intent.training_phrases
+                )
             else:
-                if "training_phrases" in intent:
-                    for training_phrase in intent.training_phrases:
-                        text_list = []
-                        if len(training_phrase.parts) > 1:
-                            for item in training_phrase.parts:
-                                text_list.append(item.text)
-                            intent_dict[intent.display_name].append(
-                                "".join(text_list))
-                        else:
-                            intent_dict[intent.display_name].append(
-                                training_phrase.parts[0].text
-                            )
-                else:
-                    intent_dict[intent.display_name].append("")
-
-        dataframe = pd.DataFrame.from_dict(
-            intent_dict, orient="index").transpose()
-        dataframe = dataframe.stack().to_frame().reset_index(level=1)
-        dataframe = dataframe.rename(
-            columns={"level_1": "display_name",
-            0: "training_phrase"}).reset_index(drop=True)
-        dataframe = dataframe.sort_values(["display_name", "training_phrase"])
+                intent_dict[intent.display_name].append("")
+
+        # Flatten to one row per phrase and build the DataFrame in one pass,
+        # rather than reshaping a wide, NaN padded frame.
+        dataframe = pd.DataFrame({
+            "display_name": [
+                name for name, phrases in intent_dict.items()
+                for _ in phrases
+            ],
+            "training_phrase": [
+                phrase for phrases in intent_dict.values()
+                for phrase in phrases
+            ],
+        })
+        dataframe = dataframe.sort_values(
+            ["display_name", "training_phrase"]).reset_index(drop=True)
 
         return dataframe, intent_dict
@@ -112,26 +112,28 @@ class Pages(scrapi_base.ScrapiBase):
 
         return pages_dict
 
-    def list_pages(self, flow_id: str = None) -> List[gcdc_page.Page]:
+    def list_pages(
+        self, flow_id: str = None, page_size: int = 1000
+    ) -> List[gcdc_page.Page]:
         """Get a List of all pages for the specified Flow ID.
 
         Args:
           flow_id: the properly formatted Flow ID string
+          page_size: (Optional) the maximum number of items to return in a
+            single page. At most 1000, defaults to 1000.
 
         Returns:
           A List of CX Page objects for the specific Flow ID
         """
         request = gcdc_page.ListPagesRequest()
         request.parent = flow_id
+        request.page_size = page_size
 
-        client_options = self._set_region(flow_id)
-        client = pages.PagesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(pages.PagesClient, flow_id)
         response = client.list_pages(request)
 
         cx_pages = []
-        for page in response.pages:
+        for page in self._prefetch_pages(response.pages):
             for cx_page in page.pages:
                 cx_pages.append(cx_page)
 
@@ -149,10 +151,7 @@ class Pages(scrapi_base.ScrapiBase):
         if not page_id:
             page_id = self.page_id
 
-        client_options = self._set_region(page_id)
-        client = pages.PagesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(pages.PagesClient, page_id)
 
         response = client.get_page(name=page_id)
 
@@ -182,10 +181,7 @@ class Pages(scrapi_base.ScrapiBase):
         for key, value in kwargs.items():
             setattr(page, key, value)
 
-        client_options = self._set_region(flow_id)
-        client = pages.PagesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(pages.PagesClient, flow_id)
 
         response = client.create_page(parent=flow_id, page=page)
 
@@ -216,10 +212,7 @@ class Pages(scrapi_base.ScrapiBase):
         paths = kwargs.keys()
         mask = field_mask_pb2.FieldMask(paths=paths)
 
-        client_options = self._set_region(page_id)
-        client = pages.PagesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(pages.PagesClient, page_id)
 
         response = client.update_page(page=page, update_mask=mask)
 
@@ -236,10 +229,7 @@ class Pages(scrapi_base.ScrapiBase):
         Returns:
           String "Page `{page_id}` successfully deleted."
         """
-        client_options = self._set_region(page_id)
-        client = pages.PagesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(pages.PagesClient, page_id)
         client.delete_page(name=page_id)
 
         return f"Page `{page_id}` successfully deleted."
@@ -17,8 +17,13 @@
 import logging
 import json
 import re
+import threading
 
+from concurrent import futures
 from typing import Dict
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from google.oauth2 import service_account
 from google.auth.transport.requests import Request
 from google.protobuf import json_format  # type: ignore
@@ -27,6 +32,61 @@ from proto.marshal.collections import repeated
 from proto.marshal.collections import maps
 
 
+def _build_auth_session():
+    """Build a pooled HTTP session for OAuth token refreshes."""
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # Token refreshes are POSTs, which are not retried on status
+                # by default. Refreshing a token is safe to repeat.
+                allowed_methods=frozenset(["GET", "POST"]),
+                # Hand the last response back instead of raising, so
+                # google-auth still raises its usual RefreshError.
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
+
+
+# Token refreshes share one session so the TLS connection to the OAuth
+# endpoint is reused instead of opening a new one per SCRAPI instance.
+_AUTH_REQUEST = Request(session=_build_auth_session())
+
+# Credentials loaded from a file, keyed by path and scopes, so instances
+# built from the same file share one token until it expires.
+_FILE_CREDS_CACHE = {}
+_FILE_CREDS_LOCK = threading.Lock()
+
+
+def _get_file_credentials(creds_path, scopes):
+    """Load file credentials once and refresh them only when expired.
+
+    The key file is never re-read after the first load in this process, so
+    a key rotated at the same path is not picked up until restart.
+    """
+    key = (creds_path, tuple(scopes))
+    with _FILE_CREDS_LOCK:
+        creds = _FILE_CREDS_CACHE.get(key)
+        if creds is None:
+            creds = service_account.Credentials.from_service_account_file(
+                creds_path, scopes=scopes
+            )
+            _FILE_CREDS_CACHE[key] = creds
+
+        if not creds.valid:
+            creds.refresh(_AUTH_REQUEST)
+
+    return creds
+
+
 class ScrapiBase:
     """Core Class for managing Auth and other shared functions."""
 
@@ -50,19 +110,19 @@ class ScrapiBase:
 
         if creds:
             self.creds = creds
-            self.creds.refresh(Request())
+            # Credentials are often shared between SCRAPI classes, so only
+            # refresh them if the token is missing or expired.
+            if not self.creds.valid:
+                self.creds.refresh(_AUTH_REQUEST)
             self.token = self.creds.token
         elif creds_path:
-            self.creds = service_account.Credentials.from_service_account_file(
-                creds_path, scopes=self.scopes
-            )
-            self.creds.refresh(Request())
+            self.creds = _get_file_credentials(creds_path, self.scopes)
             self.token = self.creds.token
         elif creds_dict:
             self.creds = service_account.Credentials.from_service_account_info(
                 creds_dict, scopes=self.scopes
             )
-            self.creds.refresh(Request())
+            self.creds.refresh(_AUTH_REQUEST)
             self.token = self.creds.token
         else:
             self.creds = None
@@ -71,6 +131,10 @@ class ScrapiBase:
         if agent_id:
             self.agent_id = agent_id
 
+        # API clients reused across calls, keyed by client class and endpoint
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+
     @staticmethod
     def _set_region(item_id):
         """Different regions have different API endpoints
@@ -98,6 +162,64 @@ class ScrapiBase:
         else:
             return None  # explicit None return when not required
 
+    def _get_client(self, client_class, item_id):
+        """Get an API client for the region of item_id, creating it once.
+
+        Each client holds its own authenticated gRPC channel, so reusing the
+        client across calls avoids opening a new connection for every request.
+
+        Args:
+          client_class: the CX service client class to use, i.e.
+            services.intents.IntentsClient
+          item_id: agent/flow/page - any type of long path id like
+            `projects/<GCP PROJECT ID>/locations/<LOCATION ID>
+
+        Returns:
+          An instance of client_class for the API endpoint of item_id
+        """
+        client_options = self._set_region(item_id)
+        endpoint = client_options["api_endpoint"] if client_options else None
+        key = (client_class, endpoint)
+
+        client = self._clients.get(key)
+        if client is None:
+            # Threaded callers may race here, so only one of them should
+            # build the client and its gRPC channel.
+            with self._clients_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = client_class(
+                        credentials=self.creds, client_options=client_options
+                    )
+                    self._clients[key] = client
+
+        return client
+
+    @staticmethod
+    def _prefetch_pages(pages):
+        """Iterate over the pages of a List response, one page ahead.
+
+        The pagers on the CX clients only request the next page once the
+        current one has been consumed. This requests the next page in the
+        background while the caller is still processing the current one.
+
+        Args:
+          pages: the `pages` iterator of a List method response
+
+        Yields:
+          Each page of the List method response, in order
+        """
+        pages = iter(pages)
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(next, pages, None)
+            while True:
+                page = next_page.result()
+                if page is None:
+                    break
+
+                next_page = executor.submit(next, pages, None)
+                yield page
+
     @staticmethod
     def pbuf_to_dict(pbuf):
         """Extractor of json from a protobuf"""
@@ -16,6 +16,7 @@
 
 import logging
 import time
+from concurrent import futures
 from typing import Dict
 import pandas as pd
 from google.cloud.dialogflowcx_v3beta1 import services
@@ -78,30 +79,22 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
         key = list(element_dict.keys())[0]
 
         if key == "payload":
-            temp_dict.update({"custom_payload": element_dict[key]})
+            temp_dict["custom_payload"] = element_dict[key]
         elif key == "liveAgentHandoff":
-            temp_dict.update(
-                {"live_agent_handoff": element_dict[key]["metadata"]}
-            )
+            temp_dict["live_agent_handoff"] = element_dict[key]["metadata"]
         elif key == "conversationSuccess":
-            temp_dict.update(
-                {"conversation_success": element_dict[key]["metadata"]}
-            )
+            temp_dict["conversation_success"] = element_dict[key]["metadata"]
         elif key == "playAudio":
-            temp_dict.update({"play_audio": element_dict[key]["audioUri"]})
+            temp_dict["play_audio"] = element_dict[key]["audioUri"]
         elif key == "outputAudioText":
-            temp_dict.update({"output_audio_text": element_dict[key]["text"]})
+            temp_dict["output_audio_text"] = element_dict[key]["text"]
         elif key == "text":
             if len(element_dict[key]["text"]) == 1:
-                temp_dict.update(
-                    {"fulfillment_message": element_dict[key]["text"][0]}
-                )
+                temp_dict["fulfillment_message"] = element_dict[key]["text"][0]
             else:
-                temp_dict.update(
-                    {"fulfillment_message": element_dict[key]["text"]}
-                )
+                temp_dict["fulfillment_message"] = element_dict[key]["text"]
         else:
-            temp_dict.update({key: element_dict[key]})
+            temp_dict[key] = element_dict[key]
 
         return temp_dict
 
@@ -134,11 +127,15 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
 
         return pages_dict
 
-    def list_transition_route_groups(self, flow_id: str = None):
+    def list_transition_route_groups(
+        self, flow_id: str = None, page_size: int = 1000
+    ):
         """Exports List of all Route Groups in the specified CX Flow ID.
 
         Args:
           flow_id: The formatted CX Flow ID to list the route groups from
+          page_size: (Optional) the maximum number of items to return in a
+            single page. At most 1000, defaults to 1000.
 
         Returns:
           List of Route Group objects
@@ -150,15 +147,16 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
             types.transition_route_group.ListTransitionRouteGroupsRequest()
         )
         request.parent = flow_id
+        request.page_size = page_size
 
-        client_options = self._set_region(flow_id)
-        client = services.transition_route_groups.TransitionRouteGroupsClient(
-            credentials=self.creds, client_options=client_options
+        client = self._get_client(
+            services.transition_route_groups.TransitionRouteGroupsClient,
+            flow_id
         )
         response = client.list_transition_route_groups(request)
 
         cx_route_groups = []
-        for page in response.pages:
+        for page in self._prefetch_pages(response.pages):
             for cx_route_group in page.transition_route_groups:
                 cx_route_groups.append(cx_route_group)
 
@@ -175,9 +173,9 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
         """
         request = types.transition_route_group.GetTransitionRouteGroupRequest()
         request.name = route_group_id
-        client_options = self._set_region(route_group_id)
-        client = services.transition_route_groups.TransitionRouteGroupsClient(
-            credentials=self.creds, client_options=client_options
+        client = self._get_client(
+            services.transition_route_groups.TransitionRouteGroupsClient,
+            route_group_id
         )
         response = client.get_transition_route_group(request)
 
@@ -212,9 +210,9 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
         for key, value in kwargs.items():
             setattr(trg, key, value)
 
-        client_options = self._set_region(flow_id)
-        client = services.transition_route_groups.TransitionRouteGroupsClient(
-            credentials=self.creds, client_options=client_options
+        client = self._get_client(
+            services.transition_route_groups.TransitionRouteGroupsClient,
+            flow_id
         )
         response = client.create_transition_route_group(
             parent=flow_id, transition_route_group=trg
@@ -252,9 +250,9 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
         paths = kwargs.keys()
         mask = field_mask_pb2.FieldMask(paths=paths)
 
-        client_options = self._set_region(route_group_id)
-        client = services.transition_route_groups.TransitionRouteGroupsClient(
-            credentials=self.creds, client_options=client_options
+        client = self._get_client(
+            services.transition_route_groups.TransitionRouteGroupsClient,
+            route_group_id
         )
 
         request = (
@@ -294,54 +292,66 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
           a Pandas Dataframe with columns: flow, route_group_name, target_page,
           intent, condition, webhook, webhook_tag, custom_payload,
           live_agent_handoff, conversation_success, play_audio,
-          output_audio_text, fulfillment_message
+          output_audio_text, fulfillment_message. All columns have object
+          dtype, and fields a route does not set are None rather than NaN.
         """
         if not agent_id:
             agent_id = self.agent_id
 
-        flows_map = self.flows.get_flows_map(agent_id)
-        intents_map = self.intents.get_intents_map(agent_id)
-        webhooks_map = self.webhooks.get_webhooks_map(agent_id)
-        all_pages_map = {}
-        all_rgs = []
-
-        for flow in flows_map:
-            all_pages_map.update(self.pages.get_pages_map(flow))
-            all_rgs.extend(self.list_transition_route_groups(flow))
-            time.sleep(rate_limit)
-
-        rows_list = []
-        for route_group in all_rgs:
-            flow = "/".join(route_group.name.split("/")[0:8])
+        # The List calls are independent, so they are issued concurrently.
+        # Per Flow calls are still started rate_limit seconds apart.
+        with futures.ThreadPoolExecutor(max_workers=16) as executor:
+            intents_future = executor.submit(
+                self.intents.get_intents_map, agent_id)
+            webhooks_future = executor.submit(
+                self.webhooks.get_webhooks_map, agent_id)
+            flows_map = self.flows.get_flows_map(agent_id)
+
+            flow_futures = []
+            for flow in flows_map:
+                flow_futures.append((
+                    flow,
+                    executor.submit(self.pages.get_pages_map, flow),
+                    executor.submit(self.list_transition_route_groups, flow),
+                ))
+                time.sleep(rate_limit)
+
+            intents_map = intents_future.result()
+            webhooks_map = webhooks_future.result()
+
+            all_pages_map = {}
+            all_rgs = []
+            for flow, pages_future, rgs_future in flow_futures:
+                all_pages_map.update(pages_future.result())
+                all_rgs.extend(
+                    (flows_map[flow], route_group)
+                    for route_group in rgs_future.result())
+
+        # Accumulate column-wise so the DataFrame is built from one list per
+        # column instead of inferring columns and dtypes from many row dicts.
+        columns = {}
+        row_count = 0
+        for flow_name, route_group in all_rgs:
             for route in route_group.transition_routes:
-                temp_dict = {}
-
-                temp_dict.update({"flow": flows_map[flow]})
-                temp_dict.update({"route_group_name": route_group.display_name})
+                temp_dict = {
+                    "flow": flow_name,
+                    "route_group_name": route_group.display_name,
+                }
 
                 if route.target_page:
-                    temp_dict.update(
-                        {"target_page": all_pages_map[route.target_page]}
-                    )
+                    temp_dict["target_page"] = all_pages_map[route.target_page]
 
                 if route.intent:
-                    temp_dict.update({"intent": intents_map[route.intent]})
+                    temp_dict["intent"] = intents_map[route.intent]
 
                 if route.condition:
-                    temp_dict.update({"condition": route.condition})
+                    temp_dict["condition"] = route.condition
 
                 if route.trigger_fulfillment.webhook:
-                    temp_dict.update(
-                        {
-                            "webhook": webhooks_map[
-                                route.trigger_fulfillment.webhook
-                            ]
-                        }
-                    )
-
-                    temp_dict.update(
-                        {"webhook_tag": route.trigger_fulfillment.tag}
-                    )
+                    temp_dict["webhook"] = webhooks_map[
+                        route.trigger_fulfillment.webhook
+                    ]
+                    temp_dict["webhook_tag"] = route.trigger_fulfillment.tag
 
                 if route.trigger_fulfillment.messages:
                     for element in route.trigger_fulfillment.messages:
@@ -349,8 +359,20 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
                             temp_dict, element
                         )
 
-                rows_list.append(temp_dict)
-
-        final_dataframe = pd.DataFrame(rows_list)
+                for key, value in temp_dict.items():
+                    # Only pad a column for earlier rows when it first appears
+                    if key not in columns:
+                        columns[key] = [None] * row_count
+                    columns[key].append(value)
+
+                row_count += 1
+                for column in columns.values():
+                    if len(column) < row_count:
+                        column.append(None)
+
+        # Every column holds strings or nested message values, so build the
+        # DataFrame as object dtype up front instead of inferring per column.
+        # Missing cells stay None instead of being converted to NaN.
+        final_dataframe = pd.DataFrame(columns, dtype=object)
 
         return final_dataframe
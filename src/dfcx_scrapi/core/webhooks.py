@@ -88,11 +88,13 @@ class Webhooks(scrapi_base.ScrapiBase):
         return webhooks_dict
 
 
-    def list_webhooks(self, agent_id: str = None):
+    def list_webhooks(self, agent_id: str = None, page_size: int = 1000):
         """List all Webhooks in the specified CX Agent.
 
         Args:
           agent_id: the formated CX Agent ID to use
+          page_size: (Optional) the maximum number of items to return in a
+            single page. At most 1000, defaults to 1000.
 
         Returns:
           List of webhook objects
@@ -102,15 +104,13 @@ class Webhooks(scrapi_base.ScrapiBase):
 
         request = types.webhook.ListWebhooksRequest()
         request.parent = agent_id
+        request.page_size = page_size
 
-        client_options = self._set_region(agent_id)
-        client = services.webhooks.WebhooksClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.webhooks.WebhooksClient, agent_id)
         response = client.list_webhooks(request)
 
         cx_webhooks = []
-        for page in response.pages:
+        for page in self._prefetch_pages(response.pages):
             for cx_webhook in page.webhooks:
                 cx_webhooks.append(cx_webhook)
 
@@ -141,9 +141,7 @@ class Webhooks(scrapi_base.ScrapiBase):
         for key, value in kwargs.items():
             setattr(webhook, key, value)
 
-        client_options = self._set_region(agent_id)
-        client = services.webhooks.WebhooksClient(
-            client_options=client_options, credentials=self.creds)
+        client = self._get_client(services.webhooks.WebhooksClient, agent_id)
         response = client.create_webhook(parent=agent_id, webhook=webhook)
 
         return response
@@ -163,9 +161,7 @@ class Webhooks(scrapi_base.ScrapiBase):
         request = types.webhook.GetWebhookRequest()
         request.name = webhook_id
 
-        client_options = self._set_region(webhook_id)
-        client = services.webhooks.WebhooksClient(
-            client_options=client_options, credentials=self.creds)
+        client = self._get_client(services.webhooks.WebhooksClient, webhook_id)
 
         response = client.get_webhook(request)
 
@@ -231,9 +227,7 @@ class Webhooks(scrapi_base.ScrapiBase):
         paths = kwargs.keys()
         mask = field_mask_pb2.FieldMask(paths=paths)
 
-        client_options = self._set_region(webhook_id)
-        client = services.webhooks.WebhooksClient(
-            client_options=client_options, credentials=self.creds)
+        client = self._get_client(services.webhooks.WebhooksClient, webhook_id)
 
         request = types.webhook.UpdateWebhookRequest()
         request.webhook = webhook_obj
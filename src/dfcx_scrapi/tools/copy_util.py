@@ -14,14 +14,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
+import asyncio
+import functools
 import logging
+import threading
 import time
+from concurrent import futures
 from typing import Dict, List
 from collections import defaultdict
 
 from google.cloud.dialogflowcx_v3beta1 import types
 from google.api_core import exceptions as core_exceptions
+from google.api_core import retry as core_retry
 
 from dfcx_scrapi.core.scrapi_base import ScrapiBase
 from dfcx_scrapi.core.intents import Intents
@@ -38,8 +42,66 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S',
 )
 
+# Pages that exist on every Flow and are referenced by name only.
+SPECIAL_PAGES = frozenset(
+    {'START_PAGE', 'END_FLOW', 'END_SESSION', 'CURRENT_PAGE'})
+
+# Default quota for design-time write requests to the Dialogflow CX API.
+# Ref: https://cloud.google.com/dialogflow/quotas
+WRITE_REQUESTS_PER_MINUTE = 60
+
+# Backoff applied to create calls that exceed the per-minute quota.
+QUOTA_RETRY = core_retry.Retry(
+    predicate=core_retry.if_exception_type(core_exceptions.ResourceExhausted),
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    deadline=120.0,
+)
+
+
+class _RateLimiter:
+    """Spaces out API calls to stay within a per-minute request quota."""
+    __slots__ = ('interval', '_next_call', '_lock')
+
+    def __init__(self, calls_per_minute: int):
+        self.interval = 60.0 / calls_per_minute
+        self._next_call = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next call is allowed under the quota."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_call - now
+            self._next_call = max(now, self._next_call) + self.interval
+
+        if delay > 0:
+            time.sleep(delay)
+
+
 class CopyUtil(ScrapiBase):
-    """Utility class for copying DFCX Resources between Agents."""
+    """Utility class for copying DFCX Resources between Agents.
+
+    Resource maps (Display Name to Resource ID lookups) are cached per
+    instance. Destination Agent maps are refreshed at the start of every
+    public copy or convert call that writes to or reads from the
+    Destination, while Source Agent maps are reused across calls. If the
+    Source Agent is modified while the same instance is in use, call
+    invalidate_maps() with its Agent ID.
+    """
+
+    # Client attribute and map method used to build each resource map. The
+    # client is looked up on every fetch, so it can be replaced after init.
+    _map_getters = {
+        'intents': ('intents', 'get_intents_map'),
+        'entities': ('entities', 'get_entities_map'),
+        'webhooks': ('webhooks', 'get_webhooks_map'),
+        'flows': ('flows', 'get_flows_map'),
+        'pages': ('pages', 'get_pages_map'),
+        'route_groups': ('route_groups', 'get_route_groups_map'),
+    }
+
     def __init__(
         self,
         creds_path: str = None,
@@ -65,12 +127,88 @@ class CopyUtil(ScrapiBase):
         self.route_groups = TransitionRouteGroups(
             creds=self.creds, agent_id=self.agent_id)
 
+        self._write_limiter = _RateLimiter(WRITE_REQUESTS_PER_MINUTE)
+
+        # Resource maps keyed by (resource type, parent ID, reverse)
+        self._map_cache = {}
+
+    def _get_map(self, resource_type, parent, reverse=False):
+        """Get a resource map, reusing any map already fetched for parent.
+
+        Args:
+          resource_type: One of `intents`, `entities`, `webhooks`, `flows`,
+            `pages`, `route_groups`
+          parent: the Agent ID for Agent level resources, or the Flow ID for
+            `pages` and `route_groups`
+          reverse: Boolean flag to swap key:value -> value:key
+
+        Returns:
+          Dictionary of resource IDs to display names, or display names to
+          resource IDs if reverse=True
+        """
+        # Read the cache once, since a concurrent _invalidate_map may drop
+        # the entry at any time.
+        resource_map = self._map_cache.get((resource_type, parent, reverse))
+        if resource_map is not None:
+            return resource_map
+
+        # Both directions come from the same List call, so we build the
+        # reverse map locally instead of making a second API call.
+        client_attr, method = self._map_getters[resource_type]
+        forward_map = getattr(getattr(self, client_attr), method)(parent)
+        reverse_map = {
+            name: resource_id for resource_id, name in forward_map.items()
+        }
+        self._map_cache[(resource_type, parent, False)] = forward_map
+        self._map_cache[(resource_type, parent, True)] = reverse_map
+
+        return reverse_map if reverse else forward_map
+
+    def _invalidate_map(self, resource_type, parent):
+        """Drop both directions of a cached map after parent is modified."""
+        for reverse in (False, True):
+            self._map_cache.pop((resource_type, parent, reverse), None)
+
+    def invalidate_maps(self, agent_id: str = None):
+        """Clear cached resource maps so they are fetched again on next use.
+
+        CopyUtil caches the resource maps it builds from the Source and
+        Destination Agents. Destination maps are already refreshed at the
+        start of each public copy or convert call, so call this method if a
+        Source Agent is modified outside of CopyUtil while the same CopyUtil
+        instance is still in use.
+
+        Args:
+          agent_id: (Optional) only clear maps for this Agent, including the
+            Pages and Route Groups maps of its Flows. If not provided, all
+            cached maps are cleared.
+        """
+        if not agent_id:
+            self._map_cache.clear()
+            return
+
+        # Match the Agent itself and its Flows, but not other Agents whose
+        # ID merely starts with the same characters.
+        agent_id = agent_id.rstrip('/')
+        for key in list(self._map_cache):
+            if key[1] == agent_id or key[1].startswith(agent_id + '/'):
+                self._map_cache.pop(key, None)
+
+    @staticmethod
+    def _is_system_entity(entity_type):
+        """Check if an Entity Type is a built-in system Entity like sys.date.
+
+        System Entities are referenced as .../entityTypes/sys.<name>, so only
+        the last path segment is checked.
+        """
+        return entity_type.rpartition('/')[2].startswith('sys.')
+
     @staticmethod
     def _get_entry_webhooks(page_object, resources):
         """Check the Entry Fulfillment for webhooks and return them."""
         if 'entry_fulfillment' in page_object:
-            if 'webhook' in page_object.entry_fulfillment:
-                resources['webhooks'].append(
+            if page_object.entry_fulfillment.webhook:
+                resources['webhooks'].add(
                     page_object.entry_fulfillment.webhook)
 
         return resources
@@ -79,11 +217,11 @@ class CopyUtil(ScrapiBase):
     @staticmethod
     def _get_condition_route_webhooks(page_object, resources):
         """Extract Webhooks from Condition for a given Page."""
-        if 'transition_routes' in page_object:
+        if page_object.transition_routes:
             for transition_route in page_object.transition_routes:
-                if ('condition' in transition_route
-                and 'webhook' in transition_route.trigger_fulfillment):
-                    resources['webhooks'].append(
+                if (transition_route.condition
+                and transition_route.trigger_fulfillment.webhook):
+                    resources['webhooks'].add(
                         transition_route.trigger_fulfillment.webhook
                     )
 
@@ -93,11 +231,11 @@ class CopyUtil(ScrapiBase):
     def _get_form_entity_types(page_object, resources):
         """Extract Entity Types from Parameters for a given Page."""
         if 'form' in page_object:
-            if 'parameters' in page_object.form:
+            if page_object.form.parameters:
                 for param in page_object.form.parameters:
-                    if 'sys.' in param.entity_type:
+                    if CopyUtil._is_system_entity(param.entity_type):
                         continue
-                    resources['entities'].append(
+                    resources['entities'].add(
                             param.entity_type
                         )
 
@@ -107,77 +245,49 @@ class CopyUtil(ScrapiBase):
     def _get_intent_route_intents(page_object, resources):
         """Extract any Intents from Transition Routes in a given Page."""
 
-        if 'transition_routes' in page_object:
+        if page_object.transition_routes:
             for transition_route in page_object.transition_routes:
-                if 'intent' in transition_route:
-                    resources['intents'].append(
+                if transition_route.intent:
+                    resources['intents'].add(
                         transition_route.intent
                     )
 
         return resources
 
     @staticmethod
-    def _convert_entry_webhooks(page_object, webhooks_map):
-        """Convert webhooks in the entry fulfillment of the Page Object.
-
-        Internal method to convert webhooks in the entry fulfillment of
-        a given page from the Resource ID to their Display Name or vice versa.
-        """
-        if 'webhook' in page_object.entry_fulfillment:
-            page_object.entry_fulfillment.webhook = webhooks_map[
-                page_object.entry_fulfillment.webhook
-            ]
-
-        return page_object
-
-    @staticmethod
-    def __convert_tr_target_page(
-        trans_route,
-        pages_map,
-        convert_type = None,
-        flows_map = None,
-        flow = None):
-
-        if convert_type == 'source':
-            if trans_route.target_page.split('/')[-1] == 'END_FLOW':
-                trans_route.target_page = 'END_FLOW'
-
-            elif trans_route.target_page.split('/')[-1] == 'END_SESSION':
-                trans_route.target_page = 'END_SESSION'
-
-            elif (
-                trans_route.target_page.split('/')[-1] == 'CURRENT_PAGE'
-            ):
-                trans_route.target_page = 'CURRENT_PAGE'
+    def _convert_target_page(target_page, pages_map, special_pages=None):
+        """Convert a target Page from Resource ID to Display Name or back.
 
-            else:
-                trans_route.target_page = pages_map[trans_route.target_page]
+        Special Pages like END_FLOW have no Display Name of their own, so they
+        map to a bare name on the Source side and back to a Page ID under the
+        Destination Flow. All other Pages are looked up in pages_map.
 
-        elif convert_type == 'destination':
-            if trans_route.target_page == 'END_FLOW':
-                trans_route.target_page = (
-                    flows_map[flow] + '/pages/END_FLOW')
-
-            elif trans_route.target_page == 'END_SESSION':
-                trans_route.target_page = (
-                    flows_map[flow] + '/pages/END_SESSION')
-
-            elif trans_route.target_page == 'CURRENT_PAGE':
-                trans_route.target_page = (
-                    flows_map[flow] + '/pages/CURRENT_PAGE')
+        Args:
+          target_page: the target Page value to convert.
+          pages_map: the Pages map to use for the lookup.
+          special_pages: map of Special Page names to their Page IDs in the
+            Destination Flow when converting to Destination Agent Resource
+            IDs. None when converting from the Source Agent.
+        """
+        if special_pages is None:
+            page_id = target_page.rpartition('/')[2]
+            if page_id in SPECIAL_PAGES:
+                return page_id
 
-            else:
-                trans_route.target_page = pages_map[trans_route.target_page]
+            return pages_map[target_page]
 
-        return trans_route.target_page
+        return special_pages.get(target_page) or pages_map[target_page]
 
     @staticmethod
-    def __convert_trigger_fulfillment_webhook(handler, webhooks_map):
-        if 'webhook' in handler.trigger_fulfillment:
-            handler.trigger_fulfillment.webhook = webhooks_map[
-                handler.trigger_fulfillment.webhook]
+    def _get_special_page_ids(flow_id):
+        """Map each Special Page name to its Page ID under flow_id."""
+        return {name: f'{flow_id}/pages/{name}' for name in SPECIAL_PAGES}
 
-        return handler.trigger_fulfillment.webhook
+    @staticmethod
+    def _convert_fulfillment_webhook(fulfillment, webhooks_map):
+        """Convert the webhook of a Fulfillment, if it has one."""
+        if fulfillment.webhook:
+            fulfillment.webhook = webhooks_map[fulfillment.webhook]
 
     def _convert_form_parameters( #pylint: disable=too-many-arguments
         self,
@@ -185,55 +295,38 @@ class CopyUtil(ScrapiBase):
         pages_map,
         webhooks_map,
         entities_map,
-        convert_type = None):
+        special_pages = None):
 
         for param in page_object.form.parameters:
             if 'fill_behavior' in param:
                 if 'initial_prompt_fulfillment' in param.fill_behavior:
-                    if 'webhook' in (
-                        param.fill_behavior.initial_prompt_fulfillment):
-                        param.fill_behavior.initial_prompt_fulfillment.webhook = webhooks_map[ #pylint: disable=line-too-long
-                            param.fill_behavior.initial_prompt_fulfillment.webhook #pylint: disable=line-too-long
-                        ]
+                    self._convert_fulfillment_webhook(
+                        param.fill_behavior.initial_prompt_fulfillment,
+                        webhooks_map)
 
-                if 'reprompt_event_handlers' in param.fill_behavior:
-                    for handler in param.fill_behavior.reprompt_event_handlers:
-                        if 'trigger_fulfillment' in handler:
-                            handler.trigger_fulfillment.webhook = (
-                                self.__convert_trigger_fulfillment_webhook(
-                                    handler, webhooks_map)
-                            )
-
-                        if 'target_page' in handler:
-                            handler.target_page = (
-                                self.__convert_tr_target_page(
-                                    handler, pages_map,
-                                    convert_type=convert_type)
-                            )
+                if param.fill_behavior.reprompt_event_handlers:
+                    self._convert_event_handlers(
+                        param.fill_behavior.reprompt_event_handlers,
+                        pages_map, webhooks_map, special_pages)
 
-            if 'sys.' in param.entity_type:
-                pass
-            else:
+            if not self._is_system_entity(param.entity_type):
                 param.entity_type = entities_map[param.entity_type]
 
         return page_object
 
     def _convert_event_handlers(
-        self, page_object, pages_map, webhooks_map, convert_type = None):
+        self, handlers, pages_map, webhooks_map, special_pages = None):
 
-        for handler in page_object.event_handlers:
-            if 'target_page' in handler:
-                handler.target_page = self.__convert_tr_target_page(
-                    handler, pages_map, convert_type=convert_type)
+        for handler in handlers:
+            if handler.target_page:
+                handler.target_page = self._convert_target_page(
+                    handler.target_page, pages_map, special_pages)
 
             if 'trigger_fulfillment' in handler:
-                handler.trigger_fulfillment.webhook = (
-                    self.__convert_trigger_fulfillment_webhook(
-                        handler, webhooks_map
-                    )
-                )
+                self._convert_fulfillment_webhook(
+                    handler.trigger_fulfillment, webhooks_map)
 
-        return page_object
+        return handlers
 
     def _convert_trans_routes( #pylint: disable=too-many-arguments
         self,
@@ -241,41 +334,33 @@ class CopyUtil(ScrapiBase):
         pages_map,
         intents_map,
         webhooks_map,
-        convert_type = None):
+        special_pages = None):
 
         for trans_route in page_object.transition_routes:
-            if 'target_page' in trans_route:
-                trans_route.target_page = self.__convert_tr_target_page(
-                    trans_route, pages_map, convert_type=convert_type)
+            if trans_route.target_page:
+                trans_route.target_page = self._convert_target_page(
+                    trans_route.target_page, pages_map, special_pages)
 
-            if 'intent' in trans_route:
+            if trans_route.intent:
                 trans_route.intent = intents_map[trans_route.intent]
-                if 'webhook' in trans_route.trigger_fulfillment:
-                    trans_route.trigger_fulfillment.webhook = webhooks_map[
-                        trans_route.trigger_fulfillment.webhook
-                    ]
-            elif (
-                'condition' in trans_route
-                and 'webhook' in trans_route.trigger_fulfillment
-            ):
-                trans_route.trigger_fulfillment.webhook = webhooks_map[
-                    trans_route.trigger_fulfillment.webhook
-                ]
+
+            self._convert_fulfillment_webhook(
+                trans_route.trigger_fulfillment, webhooks_map)
 
         return page_object
 
     def _get_intent_entity_dependencies(self, resources):
         """Loop through Intents and find any additional Entity dependencies"""
-        agent = '/'.join(resources['intents'][0].split('/')[0:6])
+        agent = '/'.join(next(iter(resources['intents'])).split('/')[0:6])
         temp_intents = self.intents.list_intents(agent)
 
         for intent in temp_intents:
             if intent.name in resources['intents']:
                 if len(intent.parameters) > 0:
                     for param in intent.parameters:
-                        if 'sys.' in param.entity_type:
+                        if self._is_system_entity(param.entity_type):
                             continue
-                        resources['entities'].append(param.entity_type)
+                        resources['entities'].add(param.entity_type)
 
         return resources
 
@@ -291,52 +376,77 @@ class CopyUtil(ScrapiBase):
         temp_page_name_list = [page.name for page in obj_list]
 
         for transition_route in source_flow.transition_routes:
-            if 'intent' in transition_route:
+            if transition_route.intent:
                 if transition_route.target_page in temp_page_name_list:
-                    resources['intents'].append(transition_route.intent)
+                    resources['intents'].add(transition_route.intent)
 
         return resources
 
-    def _get_route_groups_and_intents(self, page_object, flow_id, resources):
+    @staticmethod
+    def _get_route_groups_and_intents(
+        page_object, route_groups_by_name, resources):
         """Extract Intent resources from Transition Route Groups on a Page."""
-        route_groups = self.route_groups.list_transition_route_groups(flow_id)
-
-        if 'transition_route_groups' in page_object:
-            for trg in page_object.transition_route_groups:
-                resources['route_groups'].append(trg)
-                for route_group in route_groups:
-                    if trg == route_group.name:
-                        for transition_route in route_group.transition_routes:
-                            resources['intents'].append(
-                                transition_route.intent)
+        for trg in page_object.transition_route_groups:
+            resources['route_groups'].add(trg)
+            route_group = route_groups_by_name.get(trg)
+            if route_group:
+                intents = [
+                    transition_route.intent
+                    for transition_route in route_group.transition_routes
+                    if transition_route.intent]
+                if intents:
+                    resources['intents'].update(intents)
 
         return resources
 
+    def _get_id_translation(
+        self, resource_type, source_parent, destination_parent):
+        """Build a Source to Destination Resource ID lookup table.
+
+        Resources are matched on Display Name. Source Resources that have no
+        counterpart in the Destination are left out of the table.
+
+        Args:
+          resource_type: One of `intents`, `entities`, `webhooks`, `flows`,
+            `pages`, `route_groups`
+          source_parent: the Source Agent ID, or Flow ID for `pages` and
+            `route_groups`
+          destination_parent: the Destination Agent ID, or Flow ID for
+            `pages` and `route_groups`
+
+        Returns:
+          Dictionary of Source Resource IDs to Destination Resource IDs
+        """
+        source_map = self._get_map(resource_type, source_parent)
+        destination_map = self._get_map(
+            resource_type, destination_parent, reverse=True)
+
+        return {
+            source_id: destination_map[name]
+            for source_id, name in source_map.items()
+            if name in destination_map
+        }
+
     def _remap_parameters_in_intent(
         self,
         source_agent,
         destination_agent,
-        intent_object):
+        intent_object,
+        entity_translation = None):
         """Remap the Entity Type Resource ID from the Source to Destination.
 
-        Internal function to find the Source Entity Type Resource ID, convert
-        it to the Display Name, perform a lookup in the Destination Agent, and
-        convert that final Resource ID to the Desitnation Agent Entity Type
-        Resource ID
+        Internal function to convert each Source Agent Entity Type Resource
+        ID to the Destination Agent Entity Type Resource ID with the same
+        Display Name. Pass entity_translation when remapping many Intents so
+        the lookup table is only built once.
         """
-
-        source_entities_map = self.entities.get_entities_map(source_agent)
-        destination_entities_map = self.entities.get_entities_map(
-            destination_agent, reverse=True
-            )
+        if entity_translation is None:
+            entity_translation = self._get_id_translation(
+                'entities', source_agent, destination_agent)
 
         for param in intent_object.parameters:
-            if 'sys.' in param.entity_type:
-                pass
-            else:
-                source_name = source_entities_map[param.entity_type]
-                destination_name = destination_entities_map[source_name]
-                param.entity_type = destination_name
+            if not self._is_system_entity(param.entity_type):
+                param.entity_type = entity_translation[param.entity_type]
 
         return intent_object
 
@@ -373,12 +483,12 @@ class CopyUtil(ScrapiBase):
             logging.info(
                 'Intent %s created successfully', intent_object.display_name)
 
-        except core_exceptions.AlreadyExists as error:
-            print(error)
-            print(
-                'If you are trying to update an existing Intent, use the'
-                + ' \'update\' option instead'
-            )
+        except core_exceptions.AlreadyExists:
+            logging.info(
+                'Intent %s already exists. If you are trying to update an '
+                'existing Intent, use the \'update\' option instead.',
+                intent_object.display_name)
+            logging.debug('Create failed', exc_info=True)
 
     def _get_resource_objects(
         self,
@@ -387,54 +497,152 @@ class CopyUtil(ScrapiBase):
         resources_objects,
         skip_list):
 
-        if 'entities' not in skip_list:
-            source_entities = self.entities.list_entity_types(source_agent)
-            for entity in source_entities:
-                if entity.name in resources['entities']:
-                    resources_objects['entities'].append(entity)
-
-        if 'intents' not in skip_list:
-            source_intents = self.intents.list_intents(source_agent)
-            for intent in source_intents:
-                if intent.name in resources['intents']:
-                    resources_objects['intents'].append(intent)
-
-        if 'webhooks' not in skip_list:
-            source_webhooks = self.webhooks.list_webhooks(source_agent)
-            for webhook in source_webhooks:
-                if webhook.name in resources['webhooks']:
-                    resources_objects['webhooks'].append(webhook)
-
-        if 'route_groups' not in skip_list:
-            source_flows_map = self.flows.get_flows_map(
-                source_agent, reverse=True
-            )
-            source_route_groups = (
-                self.route_groups.list_transition_route_groups(
-                    source_flows_map['Default Start Flow']
-                )
-            )
-            for route_group in source_route_groups:
-                if route_group.name in resources['route_groups']:
-                    resources_objects['route_groups'].append(route_group)
+        # Each resource type is an independent List call against the Source
+        # Agent, so we issue them concurrently and wait on all of them.
+        with futures.ThreadPoolExecutor() as executor:
+            source_futures = {}
+            if 'entities' not in skip_list:
+                source_futures['entities'] = executor.submit(
+                    self.entities.list_entity_types, source_agent)
+
+            if 'intents' not in skip_list:
+                source_futures['intents'] = executor.submit(
+                    self.intents.list_intents, source_agent)
+
+            if 'webhooks' not in skip_list:
+                source_futures['webhooks'] = executor.submit(
+                    self.webhooks.list_webhooks, source_agent)
+
+            if 'route_groups' not in skip_list:
+                source_futures['route_groups'] = executor.submit(
+                    self._list_default_flow_route_groups, source_agent)
+
+            source_objects = {
+                key: future.result() for key, future in source_futures.items()
+            }
+
+        for key, objects in source_objects.items():
+            wanted = set(resources.get(key, ()))
+            resources_objects[key].extend(
+                obj for obj in objects if obj.name in wanted)
 
         return resources_objects
 
+    def _prefetch_agent_maps(self, agent_id, flow, include_pages=True):
+        """Fetch the Intents, Webhooks, Flows and Pages maps concurrently.
+
+        Each map is an independent List call, so issuing them together
+        means a cold cache costs one round trip instead of four. The Pages
+        map needs the Flow ID, so it is fetched once the Flows map is in.
+        Pass include_pages=False to skip the Pages map entirely.
+        """
+        with futures.ThreadPoolExecutor(max_workers=4) as executor:
+            maps_futures = [
+                executor.submit(self._get_map, resource_type, agent_id)
+                for resource_type in ('intents', 'webhooks')
+            ]
+            flows_map = self._get_map('flows', agent_id, reverse=True)
+            if include_pages:
+                maps_futures.append(
+                    executor.submit(self._get_map, 'pages', flows_map[flow]))
+
+            for future in maps_futures:
+                future.result()
+
+    def _list_default_flow_route_groups(self, agent_id):
+        """List the Route Groups on the Default Start Flow of an Agent."""
+        flows_map = self._get_map('flows', agent_id, reverse=True)
+
+        return self.route_groups.list_transition_route_groups(
+            flows_map['Default Start Flow'])
+
+    @staticmethod
+    async def _run_in_executor(func, *args):
+        """Run a blocking method in the running event loop's executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+
+    def _create_many( #pylint: disable=too-many-arguments
+        self, create_fn, objects, label, limiter=None, concurrency=8):
+        """Create resources in parallel with a bounded pool of workers.
+
+        The Dialogflow CX API has no batch create methods, so we fan out the
+        individual create calls instead. Each call is retried if the quota
+        is exceeded.
+
+        Args:
+          create_fn: callable that takes a single resource object and
+            creates it in the Destination Agent.
+          objects: list of resource objects to create.
+          label: resource type name used in log messages, i.e. `Webhook`
+          limiter: (Optional) a _RateLimiter to pace each create call with.
+            If not provided, calls are only bounded by concurrency.
+          concurrency: maximum number of create calls in flight.
+
+        Returns:
+          A list of (object, error) tuples in the same order as objects.
+          error is None if the resource was created, or the AlreadyExists
+          exception if the resource is a duplicate.
+        """
+        def _create(obj):
+            if limiter:
+                limiter.wait()
+            logging.info('Creating %s %s...', label, obj.display_name)
+            try:
+                QUOTA_RETRY(create_fn)(obj)
+                return obj, None
+            except core_exceptions.AlreadyExists as error:
+                return obj, error
+
+        with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(_create, objects))
+
+    def _drop_existing(self, resource_type, parent, objects, label):
+        """Drop objects whose display name already exists under parent.
+
+        Duplicates are determined by display_name only, so we check them
+        against the cached Destination map instead of sending a create call
+        that is bound to fail with AlreadyExists.
+        """
+        existing = self._get_map(resource_type, parent, reverse=True)
+
+        new_objects = []
+        for obj in objects:
+            if obj.display_name in existing:
+                logging.info(
+                    '%s %s already exists. Skipping.', label, obj.display_name)
+                continue
+            new_objects.append(obj)
+
+        return new_objects
+
     def _create_webhook_resources(
         self,
         destination_agent,
         resources_objects,
         resources_skip_list):
-        for webhook in resources_objects['webhooks']:
-            logging.info('Creating Webhook %s...', webhook.display_name)
-            try:
-                self.webhooks.create_webhook(destination_agent, webhook)
-                resources_skip_list['webhooks'].append(webhook.display_name)
+        webhooks = self._drop_existing(
+            'webhooks', destination_agent, resources_objects['webhooks'],
+            'Webhook')
+
+        results = self._create_many(
+            lambda webhook: self.webhooks.create_webhook(
+                destination_agent, webhook),
+            webhooks, 'Webhook')
+
+        for webhook, error in results:
+            if error:
                 logging.info(
-                    'Webhook %s created successfully.', webhook.display_name)
+                    'Webhook %s already exists. Skipping.',
+                    webhook.display_name)
+                logging.debug('Create failed', exc_info=error)
+                continue
 
-            except core_exceptions.AlreadyExists as error:
-                logging.info(error)
+            resources_skip_list['webhooks'].append(webhook.display_name)
+            logging.info(
+                'Webhook %s created successfully.', webhook.display_name)
+
+        self._invalidate_map('webhooks', destination_agent)
 
         return resources_skip_list
 
@@ -444,16 +652,27 @@ class CopyUtil(ScrapiBase):
         resources_objects,
         resources_skip_list):
 
-        for entity in resources_objects['entities']:
-            logging.info('Creating Entity %s...', entity.display_name)
-            try:
-                self.entities.create_entity_type(destination_agent, entity)
-                resources_skip_list['entities'].append(entity.display_name)
+        entities = self._drop_existing(
+            'entities', destination_agent, resources_objects['entities'],
+            'Entity')
+
+        results = self._create_many(
+            lambda entity: self.entities.create_entity_type(
+                destination_agent, entity),
+            entities, 'Entity')
+
+        for entity, error in results:
+            if error:
                 logging.info(
-                    'Entity %s created successfully.', entity.display_name)
+                    'Entity %s already exists. Skipping.', entity.display_name)
+                logging.debug('Create failed', exc_info=error)
+                continue
 
-            except core_exceptions.AlreadyExists as error:
-                print(error)
+            resources_skip_list['entities'].append(entity.display_name)
+            logging.info(
+                'Entity %s created successfully.', entity.display_name)
+
+        self._invalidate_map('entities', destination_agent)
 
         return resources_skip_list
 
@@ -464,20 +683,38 @@ class CopyUtil(ScrapiBase):
         resources_objects,
         resources_skip_list):
 
-        for intent in resources_objects['intents']:
-            logging.info('Creating Intent %s...', intent.display_name)
-            time.sleep(1) # sleep to not overrun API rate limiter
+        entity_translation = self._get_id_translation(
+            'entities', source_agent, destination_agent)
 
-            if 'parameters' in intent:
+        intents = []
+        for intent in self._drop_existing(
+            'intents', destination_agent, resources_objects['intents'],
+            'Intent'):
+            if intent.parameters:
                 intent = self._remap_parameters_in_intent(
-                    source_agent, destination_agent, intent)
-            try:
-                self.intents.create_intent(destination_agent, intent)
-                resources_skip_list['intents'].append(intent.display_name)
-                logging.info('Intent %s created successfully',
-                  intent.display_name)
-            except core_exceptions.AlreadyExists as error:
-                print(error)
+                    source_agent, destination_agent, intent,
+                    entity_translation)
+            intents.append(intent)
+
+        # Intent creates are the bulk of a copy, so they are paced to the
+        # write quota rather than relying on retries alone.
+        results = self._create_many(
+            lambda intent: self.intents.create_intent(
+                destination_agent, intent),
+            intents, 'Intent', limiter=self._write_limiter)
+
+        for intent, error in results:
+            if error:
+                logging.info(
+                    'Intent %s already exists. Skipping.', intent.display_name)
+                logging.debug('Create failed', exc_info=error)
+                continue
+
+            resources_skip_list['intents'].append(intent.display_name)
+            logging.info('Intent %s created successfully',
+              intent.display_name)
+
+        self._invalidate_map('intents', destination_agent)
 
         return resources_skip_list
 
@@ -489,64 +726,78 @@ class CopyUtil(ScrapiBase):
         resources_objects,
         resources_skip_list):
 
-        source_flows_map = self.flows.get_flows_map(source_agent)
-        source_intents_map = self.intents.get_intents_map(source_agent)
-        source_webhooks_map = self.webhooks.get_webhooks_map(source_agent)
-        source_pages_map = self.pages.get_pages_map(
-            source_flows_map['Default Start Flow'])
-
-        destination_flows = self.flows.get_flows_map(
-            destination_agent, reverse=True)
-        destination_intents_map = self.intents.get_intents_map(
-                destination_agent, reverse=True)
-        destination_webhooks_map = self.webhooks.get_webhooks_map(
-                destination_agent, reverse=True)
-        destination_pages_map = self.pages.get_pages_map(
-                destination_flows[destination_flow], reverse=True
-            )
-
-        for route_group in resources_objects['route_groups']:
+        # Flow IDs are needed before the Pages maps can be fetched, so the
+        # map calls are issued concurrently in two rounds to warm the cache.
+        with futures.ThreadPoolExecutor() as executor:
+            flows_futures = [
+                executor.submit(
+                    self._get_map, 'flows', source_agent, reverse=True),
+                executor.submit(
+                    self._get_map, 'flows', destination_agent, reverse=True),
+            ]
+            maps_futures = [
+                executor.submit(self._get_map, resource_type, agent_id)
+                for resource_type in ('intents', 'webhooks')
+                for agent_id in (source_agent, destination_agent)
+            ]
+            source_flows_map, destination_flows = [
+                future.result() for future in flows_futures]
+
+            source_flow_id = source_flows_map['Default Start Flow']
+            destination_flow_id = destination_flows[destination_flow]
+            maps_futures += [
+                executor.submit(self._get_map, 'pages', source_flow_id),
+                executor.submit(self._get_map, 'pages', destination_flow_id),
+            ]
+            for future in maps_futures:
+                future.result()
+
+        intent_translation = self._get_id_translation(
+            'intents', source_agent, destination_agent)
+        webhook_translation = self._get_id_translation(
+            'webhooks', source_agent, destination_agent)
+        page_translation = self._get_id_translation(
+            'pages', source_flow_id, destination_flow_id)
+        special_pages = self._get_special_page_ids(destination_flow_id)
+
+        route_groups = self._drop_existing(
+            'route_groups', destination_flow_id,
+            resources_objects['route_groups'], 'Route Group')
+
+        for route_group in route_groups:
             logging.info(
                 'Creating Route Group %s...', route_group.display_name)
             for trans_route in route_group.transition_routes:
-                source_name = source_intents_map[trans_route.intent]
-                destination_name = destination_intents_map[source_name]
-                trans_route.intent = destination_name
+                if trans_route.intent:
+                    trans_route.intent = intent_translation[trans_route.intent]
 
                 if 'trigger_fulfillment' in trans_route:
-                    if 'webhook' in trans_route.trigger_fulfillment:
-                        source_webhook = source_webhooks_map[
-                            trans_route.trigger_fulfillment.webhook
-                        ]
-                        destination_webhook = destination_webhooks_map[
-                            source_webhook
-                        ]
+                    if trans_route.trigger_fulfillment.webhook:
                         trans_route.trigger_fulfillment.webhook = (
-                            destination_webhook)
+                            webhook_translation[
+                                trans_route.trigger_fulfillment.webhook])
 
-                if 'target_page' in trans_route:
-                    if trans_route.target_page.split('/')[-1] == 'END_FLOW':
-                        trans_route.target_page = (
-                            destination_flows[destination_flow]
-                            + '/pages/END_FLOW'
-                        )
-                    else:
-                        source_page = source_pages_map[trans_route.target_page]
-                        destination_page = destination_pages_map[
-                            source_page
-                        ]
-                        trans_route.target_page = destination_page
+                if trans_route.target_page:
+                    page_id = trans_route.target_page.rpartition('/')[2]
+                    trans_route.target_page = (
+                        special_pages.get(page_id)
+                        or page_translation[trans_route.target_page])
 
             try:
                 self.route_groups.create_transition_route_group(
-                    destination_flows[destination_flow], route_group
+                    destination_flow_id, route_group
                 )
                 resources_skip_list['route_groups'].append(
                     route_group.display_name)
                 logging.info('Route Group %s created successfully',
                   route_group.display_name)
-            except core_exceptions.AlreadyExists as error:
-                print(error)
+            except core_exceptions.AlreadyExists:
+                logging.info(
+                    'Route Group %s already exists. Skipping.',
+                    route_group.display_name)
+                logging.debug('Create failed', exc_info=True)
+
+        self._invalidate_map('route_groups', destination_flow_id)
 
         return resources_skip_list
 
@@ -568,12 +819,15 @@ class CopyUtil(ScrapiBase):
           copy_optoion: The update method of the copy to the new agent.
             One of 'create' or 'update'. Defaults to 'create'
         """
+        # The Destination may have changed since the last call
+        self.invalidate_maps(destination_agent)
+
         # retrieve from source agent
-        intents_map = self.intents.get_intents_map(source_agent, reverse=True)
+        intents_map = self._get_map('intents', source_agent, reverse=True)
         intent_id = intents_map[intent_display_name]
         intent_object = self.intents.get_intent(intent_id)
 
-        if 'parameters' in intent_object:
+        if intent_object.parameters:
             intent_object = self._remap_parameters_in_intent(
                 source_agent, destination_agent, intent_object
             )
@@ -590,6 +844,8 @@ class CopyUtil(ScrapiBase):
         else:
             logging.info('Invalid option. Please use \'create\' or \'update\'')
 
+        self._invalidate_map('intents', destination_agent)
+
 
     def copy_entity_type_to_agent(
         self,
@@ -608,7 +864,7 @@ class CopyUtil(ScrapiBase):
             projects/<project_id>/locations/<location_id>/agents/<agent_id>
         """
         # retrieve from source agent
-        entity_map = self.entities.get_entities_map(source_agent, reverse=True)
+        entity_map = self._get_map('entities', source_agent, reverse=True)
         entity_id = entity_map[entity_type_display_name]
         entity_object = self.entities.get_entity_type(entity_id)
 
@@ -618,8 +874,13 @@ class CopyUtil(ScrapiBase):
             logging.info('Entity Type %s created successfully',
               entity_object.display_name)
 
-        except core_exceptions.AlreadyExists as error:
-            print(error)
+        except core_exceptions.AlreadyExists:
+            logging.info(
+                'Entity Type %s already exists. Skipping.',
+                entity_object.display_name)
+            logging.debug('Create failed', exc_info=True)
+
+        self._invalidate_map('entities', destination_agent)
 
     def create_page_shells(
         self,
@@ -644,8 +905,10 @@ class CopyUtil(ScrapiBase):
         Returns:
           None
         """
-        destination_flows = self.flows.get_flows_map(
-            destination_agent, reverse=True
+        # The Destination may have changed since the last call
+        self.invalidate_maps(destination_agent)
+        destination_flows = self._get_map(
+            'flows', destination_agent, reverse=True
         )
 
         for page in pages_list:
@@ -657,10 +920,14 @@ class CopyUtil(ScrapiBase):
                 logging.info(
                     'Page %s created successfully', page.display_name
                 )
-            except core_exceptions.AlreadyExists as error:
-                logging.info(error)
+            except core_exceptions.AlreadyExists:
+                logging.info(
+                    'Page %s already exists. Skipping.', page.display_name)
+                logging.debug('Create failed', exc_info=True)
                 continue
 
+        self._invalidate_map('pages', destination_flows[destination_flow])
+
     def copy_paste_agent_resources( #pylint: disable=too-many-arguments
         self,
         resources: Dict[str, str],
@@ -695,11 +962,15 @@ class CopyUtil(ScrapiBase):
           and route_groups, with keys missing if they were in the skip_list.
           Each value is a list of display names of created CX resources.
         """
+        # The Destination may have changed since the last call
+        self.invalidate_maps(destination_agent)
+
+        skip = frozenset(skip_list or ())
         resources_objects = defaultdict(list)
         resources_skip_list = defaultdict(list)
 
         resources_objects = self._get_resource_objects(
-            source_agent, resources, resources_objects, skip_list)
+            source_agent, resources, resources_objects, skip)
 
         # Create Objects in Destination Agent
         # For all objects, we will attempt to create them in the destination
@@ -707,28 +978,53 @@ class CopyUtil(ScrapiBase):
         # it to the resources_skip_list. Duplicates are determined by
         # display_name only at this time.
 
-        if 'webhooks' in resources_objects and 'webhooks' not in skip_list:
+        if 'webhooks' in resources_objects and 'webhooks' not in skip:
             resources_skip_list = self._create_webhook_resources(
                 destination_agent, resources_objects, resources_skip_list)
 
-        if 'entities' in resources_objects and 'entities' not in skip_list:
+        if 'entities' in resources_objects and 'entities' not in skip:
             resources_skip_list = self._create_entity_resources(
                 destination_agent, resources_objects, resources_skip_list)
 
-        if 'intents' in resources_objects and 'intents' not in skip_list:
+        if 'intents' in resources_objects and 'intents' not in skip:
             resources_skip_list = self._create_intent_resources(
                 source_agent, destination_agent, resources_objects,
                 resources_skip_list)
 
         if (
             'route_groups' in resources_objects and
-            'route_groups' not in skip_list):
+            'route_groups' not in skip):
             resources_skip_list = self._create_route_group_resources(
                 source_agent, destination_agent, destination_flow,
                 resources_objects,resources_skip_list)
 
         return resources_skip_list
 
+    async def copy_paste_agent_resources_async( #pylint: disable=too-many-arguments
+        self,
+        resources: Dict[str, str],
+        source_agent: str,
+        destination_agent: str,
+        destination_flow: str = 'Default Start Flow',
+        skip_list: List[str] = None
+    ):
+        """Async version of copy_paste_agent_resources.
+
+        Runs the copy in the event loop's default executor so that callers
+        migrating several Agents can await many copies with asyncio.gather
+        on a single event loop. The resource map cache is shared with the
+        sync methods of this instance.
+
+        Args:
+          See copy_paste_agent_resources.
+
+        Returns:
+          See copy_paste_agent_resources.
+        """
+        return await self._run_in_executor(
+            self.copy_paste_agent_resources, resources, source_agent,
+            destination_agent, destination_flow, skip_list)
+
     def convert_from_source_page_dependencies(
         self,
         agent_id: str,
@@ -753,14 +1049,16 @@ class CopyUtil(ScrapiBase):
           to display names.
         """
 
-        pages_mod = copy.deepcopy(pages_list)
+        # Copy-construct each Page so the proto is cloned natively instead of
+        # walking every field with deepcopy.
+        pages_mod = [types.Page(page) for page in pages_list]
 
-        intents_map = self.intents.get_intents_map(agent_id)
-        entities_map = self.entities.get_entities_map(agent_id)
-        webhooks_map = self.webhooks.get_webhooks_map(agent_id)
-        flows_map = self.flows.get_flows_map(agent_id, reverse=True)
-        pages_map = self.pages.get_pages_map(flows_map[flow])
-        rgs_map = self.route_groups.get_route_groups_map(flows_map[flow])
+        intents_map = self._get_map('intents', agent_id)
+        entities_map = self._get_map('entities', agent_id)
+        webhooks_map = self._get_map('webhooks', agent_id)
+        flows_map = self._get_map('flows', agent_id, reverse=True)
+        pages_map = self._get_map('pages', flows_map[flow])
+        rgs_map = self._get_map('route_groups', flows_map[flow])
 
         # For each page, recurse through the resources and look for
         # specific resource types that will have local agent
@@ -770,29 +1068,25 @@ class CopyUtil(ScrapiBase):
         for page in pages_mod:
 
             if 'entry_fulfillment' in page:
-                page = self._convert_entry_webhooks(page, webhooks_map)
+                self._convert_fulfillment_webhook(
+                    page.entry_fulfillment, webhooks_map)
 
-            if 'transition_routes' in page:
+            if page.transition_routes:
                 page = self._convert_trans_routes(
-                    page, pages_map, intents_map, webhooks_map,
-                    convert_type='source')
+                    page, pages_map, intents_map, webhooks_map)
 
-            if 'event_handlers' in page:
-                page = self._convert_event_handlers(
-                    page, pages_map, webhooks_map, convert_type='source')
+            if page.event_handlers:
+                self._convert_event_handlers(
+                    page.event_handlers, pages_map, webhooks_map)
 
             if 'form' in page:
-                if 'parameters' in page.form:
+                if page.form.parameters:
                     page = self._convert_form_parameters(
-                        page, pages_map, webhooks_map, entities_map,
-                        convert_type='source')
-
-            if 'transition_route_groups' in page:
-                temp_list = []
-                for trg in page.transition_route_groups:
-                    temp_list.append(rgs_map[trg])
+                        page, pages_map, webhooks_map, entities_map)
 
-                    page.transition_route_groups = temp_list
+            if page.transition_route_groups:
+                page.transition_route_groups = [
+                    rgs_map[trg] for trg in page.transition_route_groups]
 
         return pages_mod
 
@@ -821,15 +1115,21 @@ class CopyUtil(ScrapiBase):
           resource IDs for the target agent.
         """
 
-        pages_mod = copy.deepcopy(pages_list)
-
-        intents_map = self.intents.get_intents_map(agent_id, reverse=True)
-        entities_map = self.entities.get_entities_map(agent_id, reverse=True)
-        webhooks_map = self.webhooks.get_webhooks_map(agent_id, reverse=True)
-        flows_map = self.flows.get_flows_map(agent_id, reverse=True)
-        pages_map = self.pages.get_pages_map(flows_map[flow], reverse=True)
-        rgs_map = self.route_groups.get_route_groups_map(
-            flows_map[flow], reverse=True
+        # Copy-construct each Page so the proto is cloned natively instead of
+        # walking every field with deepcopy.
+        # Pages may have been created in the Destination since the last
+        # call, i.e. with pages.create_page()
+        self.invalidate_maps(agent_id)
+
+        pages_mod = [types.Page(page) for page in pages_list]
+
+        intents_map = self._get_map('intents', agent_id, reverse=True)
+        entities_map = self._get_map('entities', agent_id, reverse=True)
+        webhooks_map = self._get_map('webhooks', agent_id, reverse=True)
+        flows_map = self._get_map('flows', agent_id, reverse=True)
+        pages_map = self._get_map('pages', flows_map[flow], reverse=True)
+        rgs_map = self._get_map(
+            'route_groups', flows_map[flow], reverse=True
         )
 
         # For each page, recurse through the resources and look for
@@ -837,38 +1137,59 @@ class CopyUtil(ScrapiBase):
         # string display_name. Perform a lookup using the map resources
         # and replace the str display_name with the appropriate str UUID
 
+        special_pages = self._get_special_page_ids(flows_map[flow])
+
         for page in pages_mod:
             page.name = pages_map[page.display_name]
 
             if 'entry_fulfillment' in page:
-                page = self._convert_entry_webhooks(page, webhooks_map)
+                self._convert_fulfillment_webhook(
+                    page.entry_fulfillment, webhooks_map)
 
-            if 'transition_routes' in page:
+            if page.transition_routes:
                 page = self._convert_trans_routes(
                     page, pages_map, intents_map, webhooks_map,
-                    convert_type='destination'
-                )
-
-            if 'event_handlers' in page:
-                page = self._convert_event_handlers(
-                    page, pages_map, webhooks_map, convert_type='destination')
+                    special_pages)
 
+            if page.event_handlers:
+                self._convert_event_handlers(
+                    page.event_handlers, pages_map, webhooks_map,
+                    special_pages)
 
             if 'form' in page:
-                if 'parameters' in page.form:
+                if page.form.parameters:
                     page = self._convert_form_parameters(
                         page, pages_map, webhooks_map, entities_map,
-                        convert_type='destination')
-
-            if 'transition_route_groups' in page:
-                temp_list = []
-                for trg in page.transition_route_groups:
-                    temp_list.append(rgs_map[trg])
+                        special_pages)
 
-                page.transition_route_groups = temp_list
+            if page.transition_route_groups:
+                page.transition_route_groups = [
+                    rgs_map[trg] for trg in page.transition_route_groups]
 
         return pages_mod
 
+    async def convert_from_source_page_dependencies_async(
+        self,
+        agent_id: str,
+        pages_list: List[types.Page],
+        flow: str = 'Default Start Flow',
+    ) -> List[types.Page]:
+        """Async version of convert_from_source_page_dependencies."""
+        return await self._run_in_executor(
+            self.convert_from_source_page_dependencies, agent_id, pages_list,
+            flow)
+
+    async def convert_to_destination_page_dependencies_async(
+        self,
+        agent_id: str,
+        pages_list: List[types.Page],
+        flow: str = 'Default Start Flow'
+    ) -> List[types.Page]:
+        """Async version of convert_to_destination_page_dependencies."""
+        return await self._run_in_executor(
+            self.convert_to_destination_page_dependencies, agent_id,
+            pages_list, flow)
+
     def convert_start_page_dependencies(
         self,
         agent_id,
@@ -898,71 +1219,78 @@ class CopyUtil(ScrapiBase):
           display names for the source option and the display names converted
           to resource IDs for the destination option.
         """
-        page_mod = copy.deepcopy(start_page)
+        if agent_type == 'destination':
+            # The Destination may have changed since the last call
+            self.invalidate_maps(agent_id)
+
+        page_mod = type(start_page)(start_page)
+
+        # Start Page routes often only target Special Pages, in which case
+        # the Pages map of the Flow is never needed.
+        target_pages = {
+            trans_route.target_page.rpartition('/')[2]
+            if agent_type == 'source' else trans_route.target_page
+            for trans_route in page_mod.transition_routes
+            if trans_route.target_page
+        }
+        needs_pages = not target_pages <= SPECIAL_PAGES
+
+        self._prefetch_agent_maps(agent_id, flow, include_pages=needs_pages)
 
         if agent_type == 'source':
-            intents_map = self.intents.get_intents_map(agent_id)
-            webhooks_map = self.webhooks.get_webhooks_map(agent_id)
-            flows_map = self.flows.get_flows_map(agent_id, reverse=True)
-            pages_map = self.pages.get_pages_map(flows_map[flow])
+            intents_map = self._get_map('intents', agent_id)
+            webhooks_map = self._get_map('webhooks', agent_id)
+            flows_map = self._get_map('flows', agent_id, reverse=True)
+            pages_map = (
+                self._get_map('pages', flows_map[flow]) if needs_pages else {})
 
             for trans_route in page_mod.transition_routes:
-                if 'target_page' in trans_route:
-                    if trans_route.target_page.split('/')[-1] == 'END_FLOW':
-                        trans_route.target_page = 'END_FLOW'
-                    elif trans_route.target_page.split('/')[-1] == 'START_PAGE':
-                        trans_route.target_page = 'START_PAGE'
-                    else:
-                        trans_route.target_page = pages_map[
-                            trans_route.target_page]
-
-                if 'intent' in trans_route:
+                if trans_route.target_page:
+                    trans_route.target_page = self._convert_target_page(
+                        trans_route.target_page, pages_map)
+
+                if trans_route.intent:
                     trans_route.intent = intents_map[trans_route.intent]
-                    if 'webhook' in trans_route.trigger_fulfillment:
+                    if trans_route.trigger_fulfillment.webhook:
                         trans_route.trigger_fulfillment.webhook = webhooks_map[
                             trans_route.trigger_fulfillment.webhook
                         ]
-                elif ('condition' in trans_route and
-                'webhook' in trans_route.trigger_fulfillment):
+                elif (trans_route.condition and
+                trans_route.trigger_fulfillment.webhook):
                     trans_route.trigger_fulfillment.webhook = webhooks_map[
                         trans_route.trigger_fulfillment.webhook
                     ]
 
         elif agent_type == 'destination':
             final_trs = []
-            intents_map = self.intents.get_intents_map(agent_id, reverse=True)
-            webhooks_map = self.webhooks.get_webhooks_map(
-                agent_id, reverse=True
-            )
-            flows_map = self.flows.get_flows_map(agent_id, reverse=True)
-            pages_map = self.pages.get_pages_map(flows_map[flow], reverse=True)
+            intents_map = self._get_map('intents', agent_id, reverse=True)
+            webhooks_map = self._get_map('webhooks', agent_id, reverse=True)
+            flows_map = self._get_map('flows', agent_id, reverse=True)
+            pages_map = (
+                self._get_map('pages', flows_map[flow], reverse=True)
+                if needs_pages else {})
+
+            special_pages = self._get_special_page_ids(flows_map[flow])
 
             page_mod.name = flows_map[flow]
-            print(page_mod.name)
+            logging.debug('Converting Start Page of %s', page_mod.name)
 
             for trans_route in page_mod.transition_routes:
-                if 'target_page' in trans_route:
-                    if trans_route.target_page in ['END_FLOW', 'START_PAGE']:
-                        if trans_route.target_page == 'END_FLOW':
-                            trans_route.target_page = (
-                                flows_map[flow] + '/pages/END_FLOW')
-                        elif trans_route.target_page == 'START_PAGE':
-                            trans_route.target_page = (
-                                flows_map[flow] + '/pages/START_PAGE'
-                            )
+                target_page = trans_route.target_page
+                if target_page in special_pages:
+                    trans_route.target_page = special_pages[target_page]
 
-                    elif trans_route.target_page in pages_map:
-                        trans_route.target_page = pages_map[
-                            trans_route.target_page]
+                elif target_page in pages_map:
+                    trans_route.target_page = pages_map[target_page]
 
-                if 'intent' in trans_route:
+                if trans_route.intent:
                     if trans_route.intent not in intents_map:
                         logging.info(
                             'Intent %s not in Intents Map. Skipping.',
                             trans_route.intent)
                     elif trans_route.intent in intents_map:
                         trans_route.intent = intents_map[trans_route.intent]
-                        if 'webhook' in trans_route.trigger_fulfillment:
+                        if trans_route.trigger_fulfillment.webhook:
                             trans_route.trigger_fulfillment.webhook = (
                                 webhooks_map[
                                     trans_route.trigger_fulfillment.webhook
@@ -971,8 +1299,8 @@ class CopyUtil(ScrapiBase):
 
                         final_trs.append(trans_route)
 
-                elif ('condition' in trans_route and
-                'webhook' in trans_route.trigger_fulfillment):
+                elif (trans_route.condition and
+                trans_route.trigger_fulfillment.webhook):
                     trans_route.trigger_fulfillment.webhook = webhooks_map[
                         trans_route.trigger_fulfillment.webhook
                     ]
@@ -992,8 +1320,13 @@ class CopyUtil(ScrapiBase):
         Returns:
           Dictionary containing all of the resource objects
         """
-        resources = defaultdict(list)
+        resources = defaultdict(set)
         flow_id = '/'.join(obj_list[0].name.split('/')[0:8])
+        route_groups_by_name = {
+            route_group.name: route_group
+            for route_group in self.route_groups.list_transition_route_groups(
+                flow_id)
+        }
 
         # Loop through Pages and find all dependencies
         for page in obj_list:
@@ -1001,8 +1334,8 @@ class CopyUtil(ScrapiBase):
             resources = self._get_condition_route_webhooks(page, resources)
             resources = self._get_intent_route_intents(page, resources)
             resources = self._get_form_entity_types(page, resources)
-            resources = self._get_route_groups_and_intents(page, flow_id,
-              resources)
+            resources = self._get_route_groups_and_intents(
+                page, route_groups_by_name, resources)
 
         # Start Pages of Flows are special Page-like objects and have different
         # structure, so we need to extract the resources from them differently.
@@ -1010,10 +1343,7 @@ class CopyUtil(ScrapiBase):
             flow_id, obj_list, resources)
 
         # Final check to look for additional Entity dependencies
-        if 'intents' in resources:
+        if resources.get('intents'):
             resources = self._get_intent_entity_dependencies(resources)
 
-        for key in resources:
-            resources[key] = set(resources[key])
-
         return resources
@@ -16,6 +16,7 @@
 
 import logging
 import time
+from concurrent import futures
 from typing import Dict, List
 from operator import attrgetter
 import pandas as pd
@@ -486,14 +487,18 @@ class SearchUtil(scrapi_base.ScrapiBase):
         # entities = self.dfcx.list_entity_types(agent_id)
         flows_map = self.flows.get_flows_map(agent_id)
 
-        params_list = []
-
-        for flow in flows_map.keys():
-            temp_pages = self.pages.list_pages(flow)
-            for page in temp_pages:
-                for param in page.form.parameters:
-                    if param.is_list:
-                        params_list.append(param.display_name)
+        # Pages are listed per Flow, so the Flows are fetched concurrently.
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            pages_per_flow = list(
+                executor.map(self.pages.list_pages, flows_map.keys()))
+
+        params_list = [
+            param.display_name
+            for flow_pages in pages_per_flow
+            for page in flow_pages
+            for param in page.form.parameters
+            if param.is_list
+        ]
 
         return params_list
 
@@ -0,0 +1,354 @@
+"""Unit Tests for Copy Util Class"""
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+from google.cloud.dialogflowcx_v3beta1 import types
+from src.dfcx_scrapi.tools import copy_util
+
+AGENT_ID = "projects/p/locations/global/agents/a1"
+FLOW_ID = f"{AGENT_ID}/flows/f1"
+
+
+def _mock_copy_util():
+    """Build a CopyUtil with mocked API clients and no credentials."""
+    scrapi_copy = copy_util.CopyUtil()
+    for client_attr in (
+        "intents", "entities", "flows", "pages", "webhooks", "route_groups"):
+        setattr(scrapi_copy, client_attr, mock.MagicMock())
+
+    return scrapi_copy
+
+def _mock_maps(scrapi_copy, maps):
+    """Serve forward resource maps from maps, keyed by (type, parent)."""
+    getters = copy_util.CopyUtil._map_getters
+    for resource_type, (client_attr, method) in getters.items():
+        getattr(getattr(scrapi_copy, client_attr), method).side_effect = (
+            lambda parent, resource_type=resource_type:
+            maps[(resource_type, parent)])
+
+@pytest.mark.unit
+def test_get_page_dependencies_empty_route_group():
+    scrapi_copy = _mock_copy_util()
+    route_group_id = f"{FLOW_ID}/transitionRouteGroups/rg1"
+    scrapi_copy.route_groups.list_transition_route_groups.return_value = [
+        types.TransitionRouteGroup(name=route_group_id, display_name="rg1")]
+    scrapi_copy.flows.get_flow.return_value = types.Flow(name=FLOW_ID)
+
+    page = types.Page(
+        name=f"{FLOW_ID}/pages/p1",
+        display_name="p1",
+        transition_route_groups=[route_group_id])
+
+    resources = scrapi_copy.get_page_dependencies([page])
+
+    assert resources["route_groups"] == {route_group_id}
+    assert not resources.get("intents")
+    scrapi_copy.intents.list_intents.assert_not_called()
+
+@pytest.mark.unit
+def test_invalidate_maps_matches_agent_id_exactly():
+    scrapi_copy = _mock_copy_util()
+    other_agent = f"{AGENT_ID}0"
+    scrapi_copy._map_cache = {
+        ("intents", AGENT_ID, False): {},
+        ("pages", FLOW_ID, False): {},
+        ("intents", other_agent, False): {},
+        ("pages", f"{other_agent}/flows/f1", False): {},
+    }
+
+    scrapi_copy.invalidate_maps(f"{AGENT_ID}/")
+
+    assert set(scrapi_copy._map_cache) == {
+        ("intents", other_agent, False),
+        ("pages", f"{other_agent}/flows/f1", False),
+    }
+
+@pytest.mark.unit
+def test_page_round_trip_with_special_pages_and_reprompts():
+    dest_agent = "projects/p/locations/global/agents/a2"
+    dest_flow = f"{dest_agent}/flows/f2"
+    scrapi_copy = _mock_copy_util()
+    _mock_maps(scrapi_copy, {
+        ("intents", AGENT_ID): {f"{AGENT_ID}/intents/i1": "greet"},
+        ("entities", AGENT_ID): {f"{AGENT_ID}/entityTypes/e1": "color"},
+        ("webhooks", AGENT_ID): {f"{AGENT_ID}/webhooks/w1": "hook"},
+        ("flows", AGENT_ID): {FLOW_ID: "Default Start Flow"},
+        ("pages", FLOW_ID): {
+            f"{FLOW_ID}/pages/p1": "p1", f"{FLOW_ID}/pages/p2": "p2"},
+        ("route_groups", FLOW_ID): {
+            f"{FLOW_ID}/transitionRouteGroups/rg1": "rg"},
+        ("intents", dest_agent): {f"{dest_agent}/intents/i2": "greet"},
+        ("entities", dest_agent): {f"{dest_agent}/entityTypes/e2": "color"},
+        ("webhooks", dest_agent): {f"{dest_agent}/webhooks/w2": "hook"},
+        ("flows", dest_agent): {dest_flow: "Default Start Flow"},
+        ("pages", dest_flow): {
+            f"{dest_flow}/pages/p3": "p1", f"{dest_flow}/pages/p4": "p2"},
+        ("route_groups", dest_flow): {
+            f"{dest_flow}/transitionRouteGroups/rg2": "rg"},
+    })
+
+    webhook = f"{AGENT_ID}/webhooks/w1"
+    source_page = types.Page(
+        name=f"{FLOW_ID}/pages/p1",
+        display_name="p1",
+        entry_fulfillment=types.Fulfillment(webhook=webhook),
+        transition_routes=[
+            types.TransitionRoute(
+                intent=f"{AGENT_ID}/intents/i1",
+                target_page=f"{FLOW_ID}/pages/p2",
+                trigger_fulfillment=types.Fulfillment(webhook=webhook)),
+            types.TransitionRoute(
+                condition="true", target_page=f"{FLOW_ID}/pages/END_FLOW"),
+        ],
+        event_handlers=[
+            types.EventHandler(
+                event="sys.no-match-default",
+                target_page=f"{FLOW_ID}/pages/CURRENT_PAGE"),
+        ],
+        form=types.Form(parameters=[
+            types.Form.Parameter(
+                display_name="color",
+                entity_type=f"{AGENT_ID}/entityTypes/e1",
+                fill_behavior=types.Form.Parameter.FillBehavior(
+                    reprompt_event_handlers=[
+                        types.EventHandler(
+                            event="sys.no-match-1",
+                            target_page=f"{FLOW_ID}/pages/p2",
+                            trigger_fulfillment=types.Fulfillment(
+                                webhook=webhook)),
+                        types.EventHandler(
+                            event="sys.no-input-1",
+                            target_page=f"{FLOW_ID}/pages/END_SESSION"),
+                    ])),
+            types.Form.Parameter(
+                display_name="any",
+                entity_type="projects/-/locations/-/agents/-/"
+                "entityTypes/sys.any"),
+        ]),
+        transition_route_groups=[f"{FLOW_ID}/transitionRouteGroups/rg1"],
+    )
+
+    converted = scrapi_copy.convert_from_source_page_dependencies(
+        AGENT_ID, [source_page])[0]
+
+    assert source_page.transition_routes[0].target_page.endswith("/p2")
+    assert converted.entry_fulfillment.webhook == "hook"
+    assert converted.transition_routes[0].intent == "greet"
+    assert converted.transition_routes[0].target_page == "p2"
+    assert converted.transition_routes[1].target_page == "END_FLOW"
+    assert converted.event_handlers[0].target_page == "CURRENT_PAGE"
+    fill_behavior = converted.form.parameters[0].fill_behavior
+    reprompts = fill_behavior.reprompt_event_handlers
+    assert reprompts[0].target_page == "p2"
+    assert reprompts[0].trigger_fulfillment.webhook == "hook"
+    assert reprompts[1].target_page == "END_SESSION"
+    assert converted.form.parameters[0].entity_type == "color"
+    assert converted.transition_route_groups == ["rg"]
+
+    dest_page = scrapi_copy.convert_to_destination_page_dependencies(
+        dest_agent, [converted])[0]
+
+    assert converted.transition_routes[0].target_page == "p2"
+    assert dest_page.name == f"{dest_flow}/pages/p3"
+    assert dest_page.entry_fulfillment.webhook == f"{dest_agent}/webhooks/w2"
+    assert dest_page.transition_routes[0].intent == f"{dest_agent}/intents/i2"
+    assert dest_page.transition_routes[0].target_page == (
+        f"{dest_flow}/pages/p4")
+    assert dest_page.transition_routes[1].target_page == (
+        f"{dest_flow}/pages/END_FLOW")
+    assert dest_page.event_handlers[0].target_page == (
+        f"{dest_flow}/pages/CURRENT_PAGE")
+    fill_behavior = dest_page.form.parameters[0].fill_behavior
+    reprompts = fill_behavior.reprompt_event_handlers
+    assert reprompts[0].target_page == f"{dest_flow}/pages/p4"
+    assert reprompts[0].trigger_fulfillment.webhook == (
+        f"{dest_agent}/webhooks/w2")
+    assert reprompts[1].target_page == f"{dest_flow}/pages/END_SESSION"
+    assert dest_page.form.parameters[0].entity_type == (
+        f"{dest_agent}/entityTypes/e2")
+    assert dest_page.form.parameters[1].entity_type.endswith("/sys.any")
+    assert dest_page.transition_route_groups == [
+        f"{dest_flow}/transitionRouteGroups/rg2"]
+
+@pytest.mark.unit
+def test_rate_limiter_spaces_calls():
+    limiter = copy_util._RateLimiter(60)
+    with mock.patch.object(copy_util.time, "monotonic", return_value=100.0), \
+        mock.patch.object(copy_util.time, "sleep") as mock_sleep:
+        for _ in range(3):
+            limiter.wait()
+
+    assert mock_sleep.call_args_list == [mock.call(1.0), mock.call(2.0)]
+
+@pytest.mark.unit
+def test_create_many_keeps_order_and_reports_already_exists():
+    scrapi_copy = _mock_copy_util()
+    scrapi_copy._write_limiter = mock.MagicMock()
+    objects = [types.Webhook(display_name=name) for name in "abcde"]
+
+    def _create(webhook):
+        if webhook.display_name == "c":
+            raise copy_util.core_exceptions.AlreadyExists("exists")
+
+    results = scrapi_copy._create_many(_create, objects, "Webhook")
+
+    assert [obj.display_name for obj, _ in results] == list("abcde")
+    assert [error is None for _, error in results] == [
+        True, True, False, True, True]
+    assert isinstance(
+        results[2][1], copy_util.core_exceptions.AlreadyExists)
+    scrapi_copy._write_limiter.wait.assert_not_called()
+
+@pytest.mark.unit
+def test_create_many_paces_with_limiter():
+    scrapi_copy = _mock_copy_util()
+    limiter = mock.MagicMock()
+    create_fn = mock.MagicMock()
+    objects = [types.Intent(display_name=name) for name in "abc"]
+
+    scrapi_copy._create_many(create_fn, objects, "Intent", limiter=limiter)
+
+    assert limiter.wait.call_count == 3
+    assert create_fn.call_count == 3
+
+@pytest.mark.unit
+def test_get_id_translation_matches_on_display_name():
+    dest_agent = "projects/p/locations/global/agents/a2"
+    scrapi_copy = _mock_copy_util()
+    _mock_maps(scrapi_copy, {
+        ("intents", AGENT_ID): {"s1": "greet", "s2": "bye"},
+        ("intents", dest_agent): {"d1": "greet", "d3": "help"},
+    })
+
+    translation = scrapi_copy._get_id_translation(
+        "intents", AGENT_ID, dest_agent)
+
+    assert translation == {"s1": "d1"}
+
+@pytest.mark.unit
+def test_convert_to_destination_refreshes_destination_maps():
+    scrapi_copy = _mock_copy_util()
+    pages = {f"{FLOW_ID}/pages/p1": "p1"}
+    _mock_maps(scrapi_copy, {
+        ("intents", AGENT_ID): {},
+        ("entities", AGENT_ID): {},
+        ("webhooks", AGENT_ID): {},
+        ("flows", AGENT_ID): {FLOW_ID: "Default Start Flow"},
+        ("pages", FLOW_ID): pages,
+        ("route_groups", FLOW_ID): {},
+    })
+    scrapi_copy.convert_to_destination_page_dependencies(
+        AGENT_ID, [types.Page(display_name="p1")])
+
+    # A Page created outside of CopyUtil, i.e. with pages.create_page()
+    pages[f"{FLOW_ID}/pages/p2"] = "p2"
+    converted = scrapi_copy.convert_to_destination_page_dependencies(
+        AGENT_ID, [types.Page(display_name="p2")])
+
+    assert converted[0].name == f"{FLOW_ID}/pages/p2"
+
+@pytest.mark.unit
+def test_copy_paste_skips_resources_existing_in_destination():
+    dest_agent = "projects/p/locations/global/agents/a2"
+    scrapi_copy = _mock_copy_util()
+    _mock_maps(scrapi_copy, {
+        ("webhooks", dest_agent): {f"{dest_agent}/webhooks/w3": "existing"},
+    })
+    scrapi_copy.webhooks.list_webhooks.return_value = [
+        types.Webhook(name=f"{AGENT_ID}/webhooks/w1", display_name="existing"),
+        types.Webhook(name=f"{AGENT_ID}/webhooks/w2", display_name="new"),
+    ]
+
+    created = scrapi_copy.copy_paste_agent_resources(
+        {"webhooks": [f"{AGENT_ID}/webhooks/w1", f"{AGENT_ID}/webhooks/w2"]},
+        AGENT_ID, dest_agent,
+        skip_list=["entities", "intents", "route_groups"])
+
+    scrapi_copy.webhooks.create_webhook.assert_called_once()
+    (_, webhook), _ = scrapi_copy.webhooks.create_webhook.call_args
+    assert webhook.display_name == "new"
+    assert created["webhooks"] == ["new"]
+    assert "existing" not in created["webhooks"]
+
+def _mock_start_page_maps(scrapi_copy):
+    """Serve one Agent's maps for the Start Page conversion tests."""
+    _mock_maps(scrapi_copy, {
+        ("intents", AGENT_ID): {f"{AGENT_ID}/intents/i1": "greet"},
+        ("webhooks", AGENT_ID): {},
+        ("flows", AGENT_ID): {FLOW_ID: "Default Start Flow"},
+        ("pages", FLOW_ID): {f"{FLOW_ID}/pages/p1": "p1"},
+    })
+
+@pytest.mark.unit
+def test_convert_source_start_page_with_only_special_pages():
+    scrapi_copy = _mock_copy_util()
+    _mock_start_page_maps(scrapi_copy)
+    start_page = types.Flow(name=FLOW_ID, transition_routes=[
+        types.TransitionRoute(
+            intent=f"{AGENT_ID}/intents/i1",
+            target_page=f"{FLOW_ID}/pages/END_FLOW")])
+
+    converted = scrapi_copy.convert_start_page_dependencies(
+        AGENT_ID, start_page)
+
+    scrapi_copy.pages.get_pages_map.assert_not_called()
+    assert converted.transition_routes[0].intent == "greet"
+    assert converted.transition_routes[0].target_page == "END_FLOW"
+
+@pytest.mark.unit
+def test_convert_source_start_page_with_page_target():
+    scrapi_copy = _mock_copy_util()
+    _mock_start_page_maps(scrapi_copy)
+    start_page = types.Flow(name=FLOW_ID, transition_routes=[
+        types.TransitionRoute(
+            intent=f"{AGENT_ID}/intents/i1",
+            target_page=f"{FLOW_ID}/pages/p1")])
+
+    converted = scrapi_copy.convert_start_page_dependencies(
+        AGENT_ID, start_page)
+
+    assert converted.transition_routes[0].target_page == "p1"
+
+@pytest.mark.unit
+def test_convert_destination_start_page_with_only_special_pages():
+    scrapi_copy = _mock_copy_util()
+    _mock_start_page_maps(scrapi_copy)
+    start_page = types.Flow(transition_routes=[
+        types.TransitionRoute(intent="greet", target_page="END_SESSION")])
+
+    converted = scrapi_copy.convert_start_page_dependencies(
+        AGENT_ID, start_page, agent_type="destination")
+
+    scrapi_copy.pages.get_pages_map.assert_not_called()
+    assert converted.name == FLOW_ID
+    assert converted.transition_routes[0].intent == (
+        f"{AGENT_ID}/intents/i1")
+    assert converted.transition_routes[0].target_page == (
+        f"{FLOW_ID}/pages/END_SESSION")
+
+@pytest.mark.unit
+def test_convert_destination_start_page_with_page_target():
+    scrapi_copy = _mock_copy_util()
+    _mock_start_page_maps(scrapi_copy)
+    start_page = types.Flow(transition_routes=[
+        types.TransitionRoute(intent="greet", target_page="p1")])
+
+    converted = scrapi_copy.convert_start_page_dependencies(
+        AGENT_ID, start_page, agent_type="destination")
+
+    assert converted.transition_routes[0].target_page == (
+        f"{FLOW_ID}/pages/p1")
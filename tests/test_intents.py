@@ -0,0 +1,57 @@
+"""Unit Tests for Intents Class"""
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+from google.cloud.dialogflowcx_v3beta1 import types
+from src.dfcx_scrapi.core import intents
+
+AGENT_ID = "projects/p/locations/global/agents/a1"
+
+
+def _training_phrase(*parts):
+    return types.Intent.TrainingPhrase(
+        parts=[types.Intent.TrainingPhrase.Part(text=part) for part in parts])
+
+@pytest.mark.unit
+def test_intents_to_df_cosine_prep():
+    scrapi_intents = intents.Intents()
+    scrapi_intents.list_intents = mock.MagicMock(return_value=[
+        types.Intent(
+            display_name="order",
+            training_phrases=[
+                _training_phrase("order a ", "pizza", " please"),
+                _training_phrase("buy"),
+                _training_phrase(),
+            ]),
+        types.Intent(display_name="empty"),
+        types.Intent(
+            display_name="Default Negative Intent",
+            training_phrases=[_training_phrase("nope")]),
+    ])
+
+    df, intent_dict = scrapi_intents.intents_to_df_cosine_prep(AGENT_ID)
+
+    scrapi_intents.list_intents.assert_called_once_with(AGENT_ID)
+    assert dict(intent_dict) == {
+        "order": ["order a pizza please", "buy", ""],
+        "empty": [""],
+    }
+    assert list(df.columns) == ["display_name", "training_phrase"]
+    assert list(df.index) == [0, 1, 2, 3]
+    assert list(df["display_name"]) == ["empty", "order", "order", "order"]
+    assert list(df["training_phrase"]) == [
+        "", "", "buy", "order a pizza please"]
@@ -0,0 +1,66 @@
+"""Unit Tests for Scrapi Base Class"""
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+from src.dfcx_scrapi.core import scrapi_base
+
+
+@pytest.mark.unit
+def test_prefetch_pages_yields_every_page_in_order():
+    pages = [["a", "b"], ["c"], ["d", "e"]]
+
+    prefetched = list(scrapi_base.ScrapiBase._prefetch_pages(pages))
+
+    assert prefetched == pages
+
+@pytest.mark.unit
+def test_prefetch_pages_empty_response():
+    assert not list(scrapi_base.ScrapiBase._prefetch_pages(iter([])))
+
+@pytest.mark.unit
+def test_file_credentials_are_shared_and_refreshed_when_invalid():
+    creds = mock.MagicMock(valid=False)
+
+    def _refresh(_):
+        creds.valid = True
+
+    creds.refresh.side_effect = _refresh
+    with mock.patch.dict(scrapi_base._FILE_CREDS_CACHE, clear=True), \
+        mock.patch.object(
+            scrapi_base.service_account.Credentials,
+            "from_service_account_file",
+            return_value=creds) as mock_from_file:
+        first = scrapi_base.ScrapiBase(creds_path="shared_creds.json")
+        second = scrapi_base.ScrapiBase(creds_path="shared_creds.json")
+
+        assert first.creds is second.creds is creds
+        mock_from_file.assert_called_once()
+        creds.refresh.assert_called_once()
+
+        creds.valid = False
+        scrapi_base.ScrapiBase(creds_path="shared_creds.json")
+
+        mock_from_file.assert_called_once()
+        assert creds.refresh.call_count == 2
+
+@pytest.mark.unit
+def test_auth_session_retries_token_refresh_posts():
+    session = scrapi_base._build_auth_session()
+    retry = session.get_adapter("https://oauth2.googleapis.com").max_retries
+
+    assert retry.is_retry("POST", 503)
+    assert not retry.raise_on_status
@@ -0,0 +1,118 @@
+"""Unit Tests for Transition Route Groups Class"""
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from google.cloud.dialogflowcx_v3beta1 import types
+from src.dfcx_scrapi.core import transition_route_groups
+
+AGENT_ID = "projects/p/locations/global/agents/a1"
+FLOW_ID = f"{AGENT_ID}/flows/f1"
+
+
+def _mock_route_groups(route_groups):
+    """Build a TransitionRouteGroups with mocked API clients."""
+    scrapi_rgs = transition_route_groups.TransitionRouteGroups()
+    for client_attr in ("flows", "intents", "pages", "webhooks"):
+        setattr(scrapi_rgs, client_attr, mock.MagicMock())
+    scrapi_rgs.flows.get_flows_map.return_value = {FLOW_ID: "Default"}
+    scrapi_rgs.intents.get_intents_map.return_value = {
+        f"{AGENT_ID}/intents/i1": "greet"}
+    scrapi_rgs.webhooks.get_webhooks_map.return_value = {
+        f"{AGENT_ID}/webhooks/w1": "hook"}
+    scrapi_rgs.pages.get_pages_map.return_value = {
+        f"{FLOW_ID}/pages/p1": "p1"}
+    scrapi_rgs.list_transition_route_groups = mock.MagicMock(
+        return_value=route_groups)
+
+    return scrapi_rgs
+
+@pytest.mark.unit
+def test_route_groups_to_dataframe_aligns_columns():
+    scrapi_rgs = _mock_route_groups([
+        types.TransitionRouteGroup(
+            display_name="rg",
+            transition_routes=[
+                types.TransitionRoute(
+                    intent=f"{AGENT_ID}/intents/i1",
+                    target_page=f"{FLOW_ID}/pages/p1"),
+                types.TransitionRoute(
+                    condition="true",
+                    trigger_fulfillment=types.Fulfillment(
+                        webhook=f"{AGENT_ID}/webhooks/w1", tag="t")),
+                types.TransitionRoute(
+                    intent=f"{AGENT_ID}/intents/i1",
+                    trigger_fulfillment=types.Fulfillment(messages=[
+                        types.ResponseMessage(
+                            text=types.ResponseMessage.Text(text=["hi"]))
+                    ])),
+            ])])
+
+    df = scrapi_rgs.route_groups_to_dataframe(AGENT_ID, rate_limit=0)
+
+    assert len(df) == 3
+    assert list(df["flow"]) == ["Default"] * 3
+    assert list(df["route_group_name"]) == ["rg"] * 3
+    assert list(df["intent"]) == ["greet", None, "greet"]
+    assert list(df["target_page"]) == ["p1", None, None]
+    assert list(df["condition"]) == [None, "true", None]
+    assert list(df["webhook"]) == [None, "hook", None]
+    assert list(df["webhook_tag"]) == [None, "t", None]
+    assert list(df["fulfillment_message"]) == [None, None, "hi"]
+
+@pytest.mark.unit
+def test_route_groups_to_dataframe_scales_linearly():
+    # Plain stand-ins keep the Route attribute access cheap, so the run time
+    # is dominated by building the columns. Padding every column on every
+    # row takes several seconds at this size.
+    route_count = 20000
+    fulfillment = SimpleNamespace(webhook="", messages=[])
+    routes = [
+        SimpleNamespace(
+            intent=f"{AGENT_ID}/intents/i1" if i % 2 else "",
+            target_page="" if i % 2 else f"{FLOW_ID}/pages/p1",
+            condition="" if i % 2 else "true",
+            trigger_fulfillment=fulfillment)
+        for i in range(route_count)]
+    scrapi_rgs = _mock_route_groups([
+        SimpleNamespace(display_name="rg", transition_routes=routes)])
+
+    start = time.perf_counter()
+    df = scrapi_rgs.route_groups_to_dataframe(AGENT_ID, rate_limit=0)
+    elapsed = time.perf_counter() - start
+
+    assert len(df) == route_count
+    assert list(df["intent"][:2]) == [None, "greet"]
+    assert list(df["target_page"][:2]) == ["p1", None]
+    assert elapsed < 1.0
+
+@pytest.mark.unit
+def test_route_groups_to_dataframe_object_columns_with_none():
+    scrapi_rgs = _mock_route_groups([
+        types.TransitionRouteGroup(
+            display_name="rg",
+            transition_routes=[
+                types.TransitionRoute(condition="true"),
+                types.TransitionRoute(intent=f"{AGENT_ID}/intents/i1"),
+            ])])
+
+    df = scrapi_rgs.route_groups_to_dataframe(AGENT_ID, rate_limit=0)
+
+    assert all(dtype == object for dtype in df.dtypes)
+    assert df["condition"][1] is None
+    assert df["intent"][0] is None